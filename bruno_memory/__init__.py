@@ -3,61 +3,128 @@ bruno-memory: Advanced memory management for bruno-ai
 
 A high-performance, multi-backend memory system providing persistent storage
 and intelligent retrieval for AI conversations and context management.
+
+Public names are resolved lazily on first access (PEP 562) rather than
+imported up front. The global ``factory`` and the built-in backend
+registrations are the exception: they are set up at import time, which
+loads bruno-core and pydantic but none of the backend drivers.
 """
 
-import importlib.metadata
-from typing import Optional
+from typing import TYPE_CHECKING, Any
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import (
+        CONFIG_CLASSES,
+        BaseMemoryBackend,
+        ChromaDBConfig,
+        MemoryConfig,
+        PostgreSQLConfig,
+        QdrantConfig,
+        RedisConfig,
+        SQLiteConfig,
+    )
+    from .exceptions import (
+        BackendNotFoundError,
+        ConfigurationError,
+        ConnectionError,
+        DuplicateError,
+        IntegrationError,
+        MemoryError,
+        NotFoundError,
+        PermissionError,
+        QueryError,
+        SerializationError,
+        StorageError,
+        ValidationError,
+    )
+    from .factory import (
+        MemoryBackendFactory,
+        MemoryFactory,
+        create_backend,
+        create_config,
+        create_from_env,
+        create_with_fallback,
+        list_backends,
+        register_backend,
+    )
+    from .managers import ContextBuilder, ConversationManager, MemoryRetriever
 
-# Import backends to trigger auto-registration
+# Kept eager on purpose. ``factory`` cannot be a lazy name: the first import of
+# the ``bruno_memory.factory`` submodule (e.g. by ``backends``) binds the module
+# to that attribute, shadowing the instance. The factory in turn is only usable
+# once ``backends`` has registered the built-in backends by import path; their
+# drivers still load on first use.
 from . import backends
-from .base import (
-    CONFIG_CLASSES,
-    BaseMemoryBackend,
-    ChromaDBConfig,
-    MemoryConfig,
-    PostgreSQLConfig,
-    QdrantConfig,
-    RedisConfig,
-    SQLiteConfig,
-)
-from .exceptions import (
-    BackendNotFoundError,
-    ConfigurationError,
-    ConnectionError,
-    DuplicateError,
-    IntegrationError,
-    MemoryError,
-    NotFoundError,
-    PermissionError,
-    QueryError,
-    SerializationError,
-    StorageError,
-    ValidationError,
+from .factory import factory
+
+# Exception classes re-exported from bruno_memory.exceptions
+_EXCEPTION_NAMES = (
+    "MemoryError",
+    "ConnectionError",
+    "ConfigurationError",
+    "ValidationError",
+    "NotFoundError",
+    "DuplicateError",
+    "PermissionError",
+    "StorageError",
+    "QueryError",
+    "SerializationError",
+    "BackendNotFoundError",
+    "IntegrationError",
 )
-from .factory import (
-    MemoryBackendFactory,
-    create_backend,
-    create_config,
-    create_from_env,
-    create_with_fallback,
-    factory,
-    list_backends,
-    register_backend,
+
+# Mapping of public name -> defining module, resolved on first access
+_getattr, __dir__ = lazy_exports(
+    __name__,
+    {
+        # Core classes
+        "BaseMemoryBackend": "bruno_memory.base",
+        "MemoryBackendFactory": "bruno_memory.factory",
+        "MemoryFactory": "bruno_memory.factory",
+        # Configuration classes
+        "MemoryConfig": "bruno_memory.base",
+        "SQLiteConfig": "bruno_memory.base",
+        "PostgreSQLConfig": "bruno_memory.base",
+        "RedisConfig": "bruno_memory.base",
+        "ChromaDBConfig": "bruno_memory.base",
+        "QdrantConfig": "bruno_memory.base",
+        "CONFIG_CLASSES": "bruno_memory.base",
+        # Factory functions
+        "create_backend": "bruno_memory.factory",
+        "create_config": "bruno_memory.factory",
+        "create_from_env": "bruno_memory.factory",
+        "create_with_fallback": "bruno_memory.factory",
+        "list_backends": "bruno_memory.factory",
+        "register_backend": "bruno_memory.factory",
+        # Manager classes
+        "ConversationManager": "bruno_memory.managers",
+        "ContextBuilder": "bruno_memory.managers",
+        "MemoryRetriever": "bruno_memory.managers",
+        # Exception classes
+        **dict.fromkeys(_EXCEPTION_NAMES, "bruno_memory.exceptions"),
+    },
 )
 
-# Import managers
-from .managers import ContextBuilder, ConversationManager, MemoryRetriever
 
-# Version handling with fallback
-try:
-    __version__ = importlib.metadata.version("bruno-memory")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.1.0"  # Fallback version
+def __getattr__(name: str) -> Any:
+    """Resolve a public name on first access and cache it in the module."""
+    if name == "__version__":
+        from ._version import _get_version
+
+        value = _get_version()
+        globals()[name] = value
+        return value
+
+    return _getattr(name)
+
 
 __all__ = [
     # Core classes
     "BaseMemoryBackend",
     "MemoryBackendFactory",
+    "MemoryFactory",
     "factory",
     # Configuration classes
     "MemoryConfig",
@@ -0,0 +1,152 @@
+"""
+Lazy module loading for heavy optional dependencies.
+
+Backend drivers (chromadb, qdrant-client, asyncpg, redis) pull in large
+dependency trees. Loading them through ``importlib.util.LazyLoader`` defers
+executing the module until the first attribute access, so defining a
+backend class costs next to nothing.
+
+Packages re-export their public names through :func:`lazy_exports`, so
+importing a package does not import its submodules either.
+"""
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType, ModuleType
+from typing import Any
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return a module whose body executes on first attribute access.
+
+    Args:
+        name: Top-level module name (e.g. 'chromadb')
+
+    Returns:
+        Module object, lazily loaded unless it was already imported
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class _LazyModule:
+    """Proxy that imports a module on first attribute access."""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self._module = module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """Return a proxy for a module that is imported on first use.
+
+    Unlike :func:`lazy_module`, dotted names (e.g. 'redis.asyncio') are
+    supported without importing the parent package up front, and a missing
+    module only raises when the proxy is first used.
+
+    Args:
+        name: Dotted module name
+
+    Returns:
+        Module proxy resolving attributes from the imported module
+    """
+    return _LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """Check whether a top-level module is installed without importing it.
+
+    Args:
+        name: Top-level module name
+
+    Returns:
+        True if the module can be imported
+    """
+    return name in sys.modules or importlib.util.find_spec(name) is not None
+
+
+def lazy_exports(
+    module_name: str,
+    table: Mapping[str, str | tuple[str, str]],
+    requirements: Mapping[str, str] | None = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module ``__getattr__``/``__dir__`` hooks (PEP 562) for lazy re-exports.
+
+    Resolved names are cached in the package namespace, so each is looked
+    up through the hook only once.
+
+    Args:
+        module_name: Name of the package the hooks are installed in
+        table: Public name -> defining module, or (module, attribute) when
+            the attribute is named differently
+        requirements: Public name -> pip package it needs. A missing package
+            is reported with an install hint and not searched for again.
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package
+    """
+    table = MappingProxyType(dict(table))
+    requirements = requirements or {}
+    # Missing-package import failures by name
+    failed: dict[str, ImportError] = {}
+
+    def __getattr__(name: str, _get: Any = table.get) -> Any:
+        spec = _get(name)
+        if spec is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        source, attr = spec if isinstance(spec, tuple) else (spec, name)
+
+        requirement = requirements.get(name)
+        package = requirement.replace("-", "_") if requirement else None
+        error = failed.get(name)
+        if error is None:
+            try:
+                value = getattr(importlib.import_module(source), attr)
+            except ImportError as e:
+                # Only a missing requirement gets the install hint; anything else is a real bug
+                if (e.name or "").split(".")[0] != package:
+                    raise
+                error = failed[name] = e
+            else:
+                setattr(sys.modules[module_name], name, value)
+                return value
+
+        raise ImportError(
+            f"{name} requires the '{requirement}' package. Install: pip install {requirement}"
+        ) from error
+
+    def __dir__() -> list[str]:
+        namespace = vars(sys.modules[module_name])
+        return sorted(set(namespace) | set(table) | set(namespace.get("__all__", ())))
+
+    return __getattr__, __dir__
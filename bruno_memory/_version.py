@@ -0,0 +1,34 @@
+"""
+Version lookup for bruno-memory.
+
+Resolving the installed distribution version scans ``sys.path`` for package
+metadata, so the result is computed once per process and only on demand.
+"""
+
+import functools
+import importlib.metadata
+
+FALLBACK_VERSION = "0.1.0"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_version() -> str:
+    """Get the installed bruno-memory version.
+
+    Prefers the ``__version__.py`` file written by hatch-vcs at build time,
+    which avoids the metadata scan entirely for built distributions.
+
+    Returns:
+        Package version, or the fallback version when not installed
+    """
+    try:
+        from .__version__ import __version__ as version
+
+        return str(version)
+    except ImportError:
+        pass
+
+    try:
+        return importlib.metadata.version("bruno-memory")
+    except importlib.metadata.PackageNotFoundError:
+        return FALLBACK_VERSION
@@ -3,23 +3,55 @@ Memory backend implementations for bruno-memory.
 
 Provides concrete implementations of the BaseMemoryBackend
 for different storage systems.
+
+Backends are registered with the factory by import path and only imported
+when first requested, so unused drivers are never loaded.
 """
 
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
 from ..base import ChromaDBConfig, PostgreSQLConfig, QdrantConfig, RedisConfig, SQLiteConfig
+from ..factory import register_lazy_backend
+
+if TYPE_CHECKING:
+    from .postgresql import PostgreSQLMemoryBackend
+    from .redis import RedisMemoryBackend
+    from .sqlite import SQLiteMemoryBackend
+    from .vector import ChromaDBBackend, QdrantBackend
+
+# Built-in backends: name -> (module, class name, config class)
+_BUILTIN_BACKENDS = {
+    "sqlite": ("bruno_memory.backends.sqlite", "SQLiteMemoryBackend", SQLiteConfig),
+    "postgresql": (
+        "bruno_memory.backends.postgresql",
+        "PostgreSQLMemoryBackend",
+        PostgreSQLConfig,
+    ),
+    "redis": ("bruno_memory.backends.redis", "RedisMemoryBackend", RedisConfig),
+    "chromadb": ("bruno_memory.backends.vector", "ChromaDBBackend", ChromaDBConfig),
+    "qdrant": ("bruno_memory.backends.vector", "QdrantBackend", QdrantConfig),
+}
+
+# Auto-register backends (imported on first request)
+for _name, (_module, _class_name, _config_class) in _BUILTIN_BACKENDS.items():
+    register_lazy_backend(_name, f"{_module}:{_class_name}", _config_class)
+del _name, _module, _class_name, _config_class
+
+# Driver package each backend class needs, for install hints
+_REQUIREMENTS = {
+    "SQLiteMemoryBackend": "aiosqlite",
+    "PostgreSQLMemoryBackend": "asyncpg",
+    "RedisMemoryBackend": "redis",
+    "ChromaDBBackend": "chromadb",
+    "QdrantBackend": "qdrant-client",
+}
 
-# Import and register backends with factory
-from ..factory import register_backend
-from .postgresql import PostgreSQLMemoryBackend
-from .redis import RedisMemoryBackend
-from .sqlite import SQLiteMemoryBackend
-from .vector import ChromaDBBackend, QdrantBackend
-
-# Auto-register backends
-register_backend("sqlite", SQLiteMemoryBackend, SQLiteConfig)
-register_backend("postgresql", PostgreSQLMemoryBackend, PostgreSQLConfig)
-register_backend("redis", RedisMemoryBackend, RedisConfig)
-register_backend("chromadb", ChromaDBBackend, ChromaDBConfig)
-register_backend("qdrant", QdrantBackend, QdrantConfig)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {class_name: module for module, class_name, _ in _BUILTIN_BACKENDS.values()},
+    _REQUIREMENTS,
+)
 
 __all__ = [
     "SQLiteMemoryBackend",
@@ -11,7 +11,6 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-import asyncpg
 from bruno_core.models import (
     ConversationContext,
     MemoryEntry,
@@ -22,16 +21,21 @@ from bruno_core.models import (
     MessageRole,
     SessionContext,
 )
+from bruno_core.models.context import UserContext
 
-from bruno_memory.base.base_backend import BaseMemoryBackend
+from bruno_memory._lazy import lazy_module
+from bruno_memory.base.base_backend import BaseMemoryBackend, pack_embedding, unpack_embedding
 from bruno_memory.base.config import PostgreSQLConfig
 from bruno_memory.exceptions import (
     ConnectionError,
+    NotFoundError,
     StorageError,
 )
 
 from .schema import get_full_schema_sql
 
+asyncpg = lazy_module("asyncpg")
+
 
 class PostgreSQLMemoryBackend(BaseMemoryBackend):
     """
@@ -186,6 +190,72 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
         except Exception as e:
             raise StorageError(f"Failed to store message: {e}") from e
 
+    async def store_messages(
+        self,
+        messages: list[Message],
+        conversation_id: UUID,
+    ) -> list[UUID]:
+        """Store several messages in a single transaction.
+
+        Args:
+            messages: Messages to store
+            conversation_id: ID of the conversation
+
+        Returns:
+            list[UUID]: IDs of the stored messages, in input order
+
+        Raises:
+            StorageError: If storage fails
+        """
+        await self._ensure_initialized()
+        for message in messages:
+            self.validate_message(message)
+
+        if not messages:
+            return []
+
+        message_ids = [uuid4() for _ in messages]
+        rows = [
+            (
+                message_id,
+                message.role.value,
+                message.content,
+                message.message_type or "text",
+                message.timestamp or datetime.now(),
+                json.dumps(message.metadata or {}),
+                None,
+                conversation_id,
+            )
+            for message_id, message in zip(message_ids, messages, strict=True)
+        ]
+
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(
+                        """
+                        INSERT INTO messages
+                        (id, role, content, message_type, timestamp, metadata, parent_id, conversation_id)
+                        VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7, $8)
+                        """,
+                        rows,
+                    )
+
+                    await conn.execute(
+                        """
+                        UPDATE conversation_contexts
+                        SET message_count = message_count + $2, updated_at = NOW()
+                        WHERE conversation_id = $1
+                        """,
+                        conversation_id,
+                        len(rows),
+                    )
+
+            return message_ids
+
+        except Exception as e:
+            raise StorageError(f"Failed to store messages: {e}") from e
+
     async def retrieve_messages(
         self,
         conversation_id: UUID,
@@ -342,10 +412,13 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
             async with self._pool.acquire() as conn:
                 memory_id = uuid4()
 
-                # Extract metadata fields
-                metadata = memory.metadata.model_dump() if memory.metadata else {}
+                # Extract metadata fields; the embedding goes to its BYTEA column
+                metadata = (
+                    memory.metadata.model_dump(exclude={"embedding"}) if memory.metadata else {}
+                )
                 importance = metadata.get("importance", 0.0)
                 confidence = metadata.get("confidence", 0.0)
+                embedding = memory.metadata.embedding if memory.metadata else None
 
                 # Convert dict to JSON string for JSONB
                 metadata_json = json.dumps(metadata)
@@ -354,8 +427,8 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                     """
                     INSERT INTO memory_entries
                     (id, content, memory_type, user_id, conversation_id, metadata,
-                     importance, confidence, expires_at)
-                    VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7, $8, $9)
+                     importance, confidence, expires_at, embedding)
+                    VALUES ($1, $2, $3, $4, $5, $6::jsonb, $7, $8, $9, $10)
                     """,
                     memory_id,
                     memory.content,
@@ -370,6 +443,7 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                     importance,
                     confidence,
                     memory.expires_at,
+                    pack_embedding(embedding) if embedding else None,
                 )
 
                 return memory_id
@@ -402,7 +476,7 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
             query = """
                 SELECT id, content, memory_type, user_id, conversation_id,
                        metadata, created_at, updated_at, last_accessed,
-                       importance, confidence, expires_at
+                       importance, confidence, expires_at, embedding
                 FROM memory_entries
                 WHERE user_id = $1
                   AND (expires_at IS NULL OR expires_at > NOW())
@@ -454,6 +528,8 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                 metadata_dict["last_accessed"] = row["last_accessed"]
                 if row["expires_at"]:
                     metadata_dict["expires_at"] = row["expires_at"]
+                if row["embedding"] is not None:
+                    metadata_dict["embedding"] = unpack_embedding(row["embedding"])
 
                 memory = MemoryEntry(
                     content=row["content"],
@@ -488,7 +564,7 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
             sql = """
                 SELECT id, content, memory_type, user_id, conversation_id,
                        metadata, created_at, updated_at, last_accessed,
-                       importance, confidence, expires_at,
+                       importance, confidence, expires_at, embedding,
                        ts_rank(to_tsvector('english', content), plainto_tsquery('english', $1)) as rank
                 FROM memory_entries
                 WHERE user_id = $2
@@ -549,6 +625,8 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                 metadata_dict["last_accessed"] = row["last_accessed"]
                 if row["expires_at"]:
                     metadata_dict["expires_at"] = row["expires_at"]
+                if row["embedding"] is not None:
+                    metadata_dict["embedding"] = unpack_embedding(row["embedding"])
 
                 memory = MemoryEntry(
                     content=row["content"],
@@ -589,8 +667,6 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                 # Check if any rows were deleted
                 deleted_count = int(result.split()[-1])
                 if deleted_count == 0:
-                    from bruno_memory.exceptions import NotFoundError
-
                     raise NotFoundError(f"Memory entry {memory_id} not found")
 
         except Exception as e:
@@ -781,25 +857,24 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
         await self._ensure_initialized()
 
         try:
-            async with self._pool.acquire() as conn:
-                # Get conversation details
-                conv_row = await conn.fetchrow(
+            # Get conversation details and recent messages concurrently
+            conv_row, messages = await asyncio.gather(
+                self._pool.fetchrow(
                     """
                     SELECT conversation_id, user_id, title, metadata, message_count, created_at, updated_at
                     FROM conversation_contexts
                     WHERE conversation_id = $1
                     """,
                     conversation_id,
-                )
-
-                if not conv_row:
-                    raise StorageError(f"Conversation {conversation_id} not found")
-
-                # Get recent messages
-                messages = await self.retrieve_messages(
+                ),
+                self.retrieve_messages(
                     conversation_id,
                     limit=max_turns * 2 if max_turns else None,  # Estimate 2 messages per turn
-                )
+                ),
+            )
+
+            if not conv_row:
+                raise StorageError(f"Conversation {conversation_id} not found")
 
             # Parse metadata JSON if string
             metadata = (
@@ -808,9 +883,6 @@ class PostgreSQLMemoryBackend(BaseMemoryBackend):
                 else (conv_row["metadata"] or {})
             )
 
-            # Import required models
-            from bruno_core.models import SessionContext, UserContext
-
             # Create required context objects
             user = UserContext(user_id=conv_row["user_id"])
             session = SessionContext(
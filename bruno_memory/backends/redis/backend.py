@@ -5,6 +5,7 @@ Optimized for caching, session management, and real-time operations
 with automatic expiration and pub/sub support.
 """
 
+import asyncio
 import pickle
 from datetime import datetime
 from typing import Any
@@ -20,8 +21,9 @@ from bruno_core.models import (
     MessageRole,
     SessionContext,
 )
-from redis.asyncio import ConnectionPool, Redis
+from bruno_core.models.context import UserContext
 
+from bruno_memory._lazy import lazy_module
 from bruno_memory.base.base_backend import BaseMemoryBackend
 from bruno_memory.base.config import RedisConfig
 from bruno_memory.exceptions import (
@@ -30,6 +32,8 @@ from bruno_memory.exceptions import (
     StorageError,
 )
 
+redis = lazy_module("redis")
+
 
 class RedisMemoryBackend(BaseMemoryBackend):
     """
@@ -60,8 +64,8 @@ class RedisMemoryBackend(BaseMemoryBackend):
         """
         super().__init__(config)
         self.config: RedisConfig = config
-        self._client: Redis | None = None
-        self._pool: ConnectionPool | None = None
+        self._client: redis.asyncio.Redis | None = None
+        self._pool: redis.asyncio.ConnectionPool | None = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -71,7 +75,7 @@ class RedisMemoryBackend(BaseMemoryBackend):
 
         try:
             # Create connection pool
-            self._pool = ConnectionPool(
+            self._pool = redis.asyncio.ConnectionPool(
                 host=self.config.host,
                 port=self.config.port,
                 db=self.config.database,
@@ -84,7 +88,7 @@ class RedisMemoryBackend(BaseMemoryBackend):
             )
 
             # Create Redis client
-            self._client = Redis(connection_pool=self._pool)
+            self._client = redis.asyncio.Redis(connection_pool=self._pool)
 
             # Test connection
             await self._client.ping()
@@ -247,6 +251,69 @@ class RedisMemoryBackend(BaseMemoryBackend):
         except Exception as e:
             raise StorageError(f"Failed to store message: {e}") from e
 
+    async def store_messages(
+        self,
+        messages: list[Message],
+        conversation_id: UUID,
+    ) -> list[UUID]:
+        """Store several messages in one pipelined round trip.
+
+        Args:
+            messages: Messages to store
+            conversation_id: Conversation ID
+
+        Returns:
+            list[UUID]: Message IDs, in input order
+
+        Raises:
+            StorageError: If storage fails
+        """
+        await self._ensure_initialized()
+        for message in messages:
+            self.validate_message(message)
+
+        if not messages:
+            return []
+
+        try:
+            messages_set_key = self._get_messages_set_key(conversation_id)
+            conversation = str(conversation_id)
+            message_ids = []
+            scores = {}
+
+            async with self._client.pipeline(transaction=True) as pipe:
+                for message in messages:
+                    message_id = uuid4()
+                    timestamp = message.timestamp or datetime.now()
+                    message_data = {
+                        "id": str(message_id),
+                        "role": message.role.value,
+                        "content": message.content,
+                        "message_type": message.message_type or "text",
+                        "timestamp": timestamp.isoformat(),
+                        "metadata": message.metadata or {},
+                        "parent_id": None,
+                        "conversation_id": conversation,
+                    }
+                    message_key = self._get_message_key(conversation_id, message_id)
+                    pipe.set(message_key, self._serialize(message_data))
+                    if self.config.ttl_default:
+                        pipe.expire(message_key, self.config.ttl_default)
+
+                    message_ids.append(message_id)
+                    scores[str(message_id)] = timestamp.timestamp()
+
+                pipe.zadd(messages_set_key, scores)
+                if self.config.ttl_default:
+                    pipe.expire(messages_set_key, self.config.ttl_default)
+
+                await pipe.execute()
+
+            return message_ids
+
+        except Exception as e:
+            raise StorageError(f"Failed to store messages: {e}") from e
+
     async def retrieve_messages(
         self,
         conversation_id: UUID,
@@ -289,13 +356,13 @@ class RedisMemoryBackend(BaseMemoryBackend):
             if not message_ids:
                 return []
 
-            # Retrieve message data
+            # Retrieve all message data in one round trip
+            message_keys = [
+                self._get_message_key(conversation_id, UUID(msg_id_bytes.decode("utf-8")))
+                for msg_id_bytes in message_ids
+            ]
             messages = []
-            for msg_id_bytes in message_ids:
-                msg_id = msg_id_bytes.decode("utf-8")
-                message_key = self._get_message_key(conversation_id, UUID(msg_id))
-
-                data = await self._client.get(message_key)
+            for data in await self._client.mget(message_keys):
                 if data:
                     message_data = self._deserialize(data)
                     message = Message(
@@ -344,8 +411,8 @@ class RedisMemoryBackend(BaseMemoryBackend):
                 cursor = 0
                 while True:
                     cursor, keys = await self._client.scan(cursor, match="msg:*:*", count=100)
-                    for key in keys:
-                        data = await self._client.get(key)
+                    values = await self._client.mget(keys) if keys else []
+                    for data in values:
                         if data:
                             message_data = self._deserialize(data)
                             message = Message(
@@ -462,13 +529,13 @@ class RedisMemoryBackend(BaseMemoryBackend):
             if not memory_ids:
                 return []
 
-            # Retrieve memory data
+            # Retrieve all memory data in one round trip
+            memory_keys = [
+                self._get_memory_key(user_id, UUID(mem_id_bytes.decode("utf-8")))
+                for mem_id_bytes in memory_ids
+            ]
             memories = []
-            for mem_id_bytes in memory_ids:
-                mem_id = mem_id_bytes.decode("utf-8")
-                memory_key = self._get_memory_key(user_id, UUID(mem_id))
-
-                data = await self._client.get(memory_key)
+            for data in await self._client.mget(memory_keys):
                 if data:
                     memory_data = self._deserialize(data)
 
@@ -786,29 +853,27 @@ class RedisMemoryBackend(BaseMemoryBackend):
         await self._ensure_initialized()
 
         try:
-            # Get conversation metadata
+            # Fetch conversation metadata and messages concurrently
             conv_key = self._get_conversation_key(conversation_id)
-            conv_data = await self._client.get(conv_key)
+            limit = max_turns * 2 if max_turns else None  # Estimate 2 messages per turn
+            conv_data, messages = await asyncio.gather(
+                self._client.get(conv_key),
+                self.retrieve_messages(conversation_id, limit=limit),
+            )
 
             if not conv_data:
                 # Create default context
+                now = datetime.now().isoformat()
                 conv_metadata = {
                     "conversation_id": str(conversation_id),
                     "user_id": "unknown",
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat(),
+                    "created_at": now,
+                    "updated_at": now,
                     "metadata": {},
                 }
             else:
                 conv_metadata = self._deserialize(conv_data)
 
-            # Get messages
-            limit = max_turns * 2 if max_turns else None  # Estimate 2 messages per turn
-            messages = await self.retrieve_messages(conversation_id, limit=limit)
-
-            # Import required for ConversationContext
-            from bruno_core.models import SessionContext, UserContext
-
             # Create required context objects
             user = UserContext(user_id=conv_metadata["user_id"])
             session = SessionContext(
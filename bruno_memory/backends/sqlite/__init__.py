@@ -5,7 +5,21 @@ Provides a high-performance, file-based memory storage solution
 with full-text search and ACID compliance.
 """
 
-from .backend import SQLiteMemoryBackend
-from .schema import SCHEMA_VERSION, get_full_schema_sql
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .backend import SQLiteMemoryBackend
+    from .schema import SCHEMA_VERSION, get_full_schema_sql
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SQLiteMemoryBackend": "bruno_memory.backends.sqlite.backend",
+        "SCHEMA_VERSION": "bruno_memory.backends.sqlite.schema",
+        "get_full_schema_sql": "bruno_memory.backends.sqlite.schema",
+    },
+)
 
 __all__ = ["SQLiteMemoryBackend", "get_full_schema_sql", "SCHEMA_VERSION"]
@@ -5,9 +5,14 @@ Provides a high-performance, file-based memory storage solution
 with full-text search, embedding support, and ACID compliance.
 """
 
-import json
+import asyncio
+import logging
 import sqlite3
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 from uuid import UUID
@@ -23,14 +28,217 @@ from bruno_core.models import (
 from bruno_core.models.context import UserContext
 
 from ...base import BaseMemoryBackend, SQLiteConfig
+from ...base.base_backend import json_dumps, json_loads, pack_embedding, unpack_embedding
 from ...exceptions import (
     ConnectionError,
     DuplicateError,
     NotFoundError,
     QueryError,
+    SerializationError,
     StorageError,
+    ValidationError,
 )
-from .schema import get_full_schema_sql
+from .pool import SQLiteReadPool
+from .schema import SCHEMA_REVISION, get_full_schema_sql
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on user contexts kept by get_context; the oldest entry is evicted first
+USER_CONTEXT_CACHE_SIZE = 10_000
+
+INSERT_MESSAGE_SQL = """
+    INSERT INTO messages (
+        id, role, content, message_type, timestamp,
+        metadata, parent_id, conversation_id, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_MEMORY_SQL = """
+    INSERT INTO memory_entries (
+        id, content, memory_type, user_id, conversation_id,
+        metadata, created_at, updated_at, last_accessed, expires_at,
+        importance, confidence, embedding
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Upserts update rows in place; INSERT OR REPLACE would delete the old row
+# first, cascading to the conversations owned by a user context
+UPSERT_SESSION_SQL = """
+    INSERT INTO session_contexts (
+        session_id, user_id, conversation_id, started_at,
+        ended_at, last_activity, is_active, state, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (session_id) DO UPDATE SET
+        ended_at = excluded.ended_at,
+        last_activity = excluded.last_activity,
+        is_active = excluded.is_active,
+        state = excluded.state,
+        metadata = excluded.metadata
+"""
+
+UPSERT_USER_CONTEXT_SQL = """
+    INSERT INTO user_contexts (
+        user_id, name, preferences, profile, metadata, created_at, last_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (user_id) DO UPDATE SET
+        name = excluded.name,
+        preferences = excluded.preferences,
+        profile = excluded.profile,
+        metadata = excluded.metadata,
+        last_active = excluded.last_active
+"""
+
+# Columns needed to rebuild models; bookkeeping columns are never fetched
+MESSAGE_COLUMNS = "id, role, content, message_type, timestamp, metadata, parent_id, conversation_id"
+MEMORY_COLUMNS = (
+    "id, content, memory_type, user_id, conversation_id, metadata, "
+    "created_at, updated_at, last_accessed, expires_at, embedding"
+)
+
+# All statistics counters in a single round trip
+STATISTICS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM messages) AS message_count,
+        (SELECT COUNT(*) FROM memory_entries) AS memory_count,
+        (SELECT COUNT(*) FROM user_contexts) AS user_count,
+        (SELECT COUNT(*) FROM conversation_contexts) AS conversation_count,
+        (SELECT COUNT(*) FROM session_contexts WHERE is_active = 1) AS active_sessions
+"""
+
+# Per-user counters; every subquery is answered from a covering index
+USER_STATISTICS_SQL = """
+    WITH user_conversations AS (
+        SELECT conversation_id FROM conversation_contexts WHERE user_id = :user_id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM messages
+         WHERE conversation_id IN user_conversations) AS message_count,
+        (SELECT COUNT(*) FROM memory_entries WHERE user_id = :user_id) AS memory_count,
+        (SELECT COUNT(*) FROM user_contexts WHERE user_id = :user_id) AS user_count,
+        (SELECT COUNT(*) FROM user_conversations) AS conversation_count,
+        (SELECT COUNT(*) FROM session_contexts
+         WHERE user_id = :user_id AND is_active = 1) AS active_sessions
+"""
+
+# Everything _initialize_schema needs to know about an existing file, in one query
+SCHEMA_STATE_SQL = """
+    SELECT
+        EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'messages_fts') AS has_messages_fts,
+        EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1') AS has_statistics,
+        (SELECT user_version FROM pragma_user_version) AS revision
+"""
+
+# Loads the schema and the root pages of the hot tables into a new connection
+WARM_UP_SQL = """
+    SELECT
+        (SELECT count(*) FROM sqlite_master),
+        (SELECT rowid FROM messages LIMIT 1),
+        (SELECT rowid FROM memory_entries LIMIT 1)
+"""
+
+# Expiry check evaluated by SQLite; the ISO-8601 text compares in time order
+NOT_EXPIRED_SQL = "(expires_at IS NULL OR expires_at > strftime('%Y-%m-%dT%H:%M:%f', 'now'))"
+
+# Candidates fetched from FTS per requested row when other filters still apply
+FTS_OVERFETCH = 10
+
+# Modes accepted by PRAGMA wal_checkpoint
+WAL_CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# Schema revision from which memory_entries.importance/confidence are populated
+IMPORTANCE_COLUMNS_REVISION = 1
+
+
+def _sanitize_fts(text: str) -> str:
+    """Turn free text into an FTS5 query that matches every term.
+
+    Each whitespace-separated term is quoted, so FTS5 operators and
+    punctuation in user input are matched literally instead of raising
+    syntax errors. A trailing ``*`` keeps its prefix-search meaning.
+
+    Args:
+        text: User-supplied search text
+
+    Returns:
+        FTS5 MATCH expression (an empty phrase if no terms remain)
+    """
+    terms = []
+    for term in text.split():
+        prefix = term.endswith("*")
+        term = term.replace('"', "").rstrip("*")
+        if term:
+            terms.append(f'"{term}"*' if prefix else f'"{term}"')
+    return " ".join(terms) or '""'
+
+
+@lru_cache(maxsize=128)
+def _memory_search_sql(
+    full_text: bool,
+    content_like: bool,
+    by_user: bool,
+    type_count: int,
+    tag_count: int,
+    include_expired: bool,
+    by_importance: bool,
+    by_confidence: bool,
+    limited: bool,
+) -> str:
+    """Build the search_memories statement for one combination of filters.
+
+    The SQL depends only on which filters are set, so identical query shapes
+    reuse the same string and hit sqlite3's prepared statement cache.
+
+    Args:
+        full_text: Whether an FTS MATCH term is bound first
+        content_like: Whether a LIKE pattern is bound first (used without FTS)
+        by_user: Whether the query is restricted to one user
+        type_count: Number of memory types in the IN list
+        tag_count: Number of tags that must all be present
+        include_expired: Whether expired entries are returned
+        by_importance: Whether a minimum importance is bound
+        by_confidence: Whether a minimum confidence is bound
+        limited: Whether a LIMIT is bound last
+
+    Returns:
+        str: SQL with positional placeholders in the order listed above
+    """
+    if full_text:
+        # Take the best FTS matches first, then apply the remaining filters
+        query_parts = [
+            "WITH fts_matches AS ("
+            "SELECT rowid FROM memory_entries_fts WHERE memory_entries_fts MATCH ? "
+            "ORDER BY rank LIMIT ?) "
+            f"SELECT {MEMORY_COLUMNS} "
+            "FROM fts_matches f JOIN memory_entries m ON m.rowid = f.rowid"
+        ]
+    else:
+        query_parts = [f"SELECT {MEMORY_COLUMNS} FROM memory_entries"]
+
+    conditions = []
+    if content_like:
+        conditions.append("content LIKE ?")
+    if by_user:
+        conditions.append("user_id = ?")
+    if type_count:
+        conditions.append(f"memory_type IN ({','.join('?' * type_count)})")
+    # Exact tag matches against the JSON tag array; every tag must be present
+    conditions.extend(
+        ["EXISTS (SELECT 1 FROM json_each(metadata, '$.tags') WHERE value = ?)"] * tag_count
+    )
+    if not include_expired:
+        conditions.append(NOT_EXPIRED_SQL)
+    if by_importance:
+        conditions.append("importance >= ?")
+    if by_confidence:
+        conditions.append("confidence >= ?")
+
+    if conditions:
+        query_parts.append("WHERE " + " AND ".join(conditions))
+    query_parts.append("ORDER BY updated_at DESC")
+    if limited:
+        query_parts.append("LIMIT ?")
+
+    return " ".join(query_parts)
 
 
 class SQLiteMemoryBackend(BaseMemoryBackend):
@@ -46,6 +254,15 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
         self.config: SQLiteConfig = config
         self._db_path = Path(config.database_path)
         self._connection: aiosqlite.Connection | None = None
+        self._read_pool: SQLiteReadPool | None = None
+        self._write_queue: asyncio.Queue[Message | MemoryEntry] | None = None
+        self._write_task: asyncio.Task[None] | None = None
+        self._maintenance_task: asyncio.Task[None] | None = None
+        # Serializes transactions on the shared writer connection
+        self._write_lock = asyncio.Lock()
+        # user_id -> (expiry, context), plus the load in flight for each user_id
+        self._user_contexts: dict[str, tuple[float, UserContext]] = {}
+        self._user_context_loads: dict[str, asyncio.Task[UserContext]] = {}
 
         # Ensure database directory exists
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -56,33 +273,89 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
             return
 
         try:
-            self._connection = await aiosqlite.connect(
-                str(self._db_path), timeout=self.config.connection_timeout
+            # Implicit transactions take the write lock up front, so a write
+            # never fails upgrading from a read lock; busy_timeout covers waits
+            self._connection = await self._open_connection(
+                str(self._db_path), isolation_level="IMMEDIATE"
             )
-
-            # Configure SQLite for optimal performance
-            await self._connection.execute("PRAGMA journal_mode = WAL")
-            await self._connection.execute("PRAGMA synchronous = NORMAL")
-            await self._connection.execute("PRAGMA cache_size = -64000")  # 64MB cache
-            await self._connection.execute("PRAGMA foreign_keys = ON")
-            await self._connection.execute("PRAGMA temp_store = MEMORY")
+            await self._configure_connection(self._connection)
 
             # Initialize schema
             await self._initialize_schema()
 
+            # In WAL mode readers never block the writer, so serve reads from
+            # a pool of read-only connections, each running on its own thread.
+            # In-memory and non-WAL databases keep all reads on the writer.
+            async with self._connection.execute("PRAGMA journal_mode") as cursor:
+                journal_mode = (await cursor.fetchone())[0]
+            if journal_mode.lower() == "wal" and self.config.read_pool_size > 0:
+                readers = []
+                try:
+                    for _ in range(self.config.read_pool_size):
+                        reader = await self._open_connection(
+                            f"{self._db_path.resolve().as_uri()}?mode=ro", uri=True
+                        )
+                        readers.append(reader)
+                        await self._configure_connection(reader, read_only=True)
+                        # Parse the schema now rather than on the first user query
+                        async with reader.execute(WARM_UP_SQL) as cursor:
+                            await cursor.fetchone()
+                except Exception:
+                    await SQLiteReadPool(readers).close()
+                    raise
+                self._read_pool = SQLiteReadPool(readers)
+
+            if self.config.async_insert:
+                self._write_queue = asyncio.Queue()
+                self._write_task = asyncio.create_task(self._write_behind())
+
+            if self.config.maintenance_interval > 0:
+                self._maintenance_task = asyncio.create_task(self._maintenance())
+
             self._connected = True
 
         except Exception as e:
+            if self._connection:
+                try:
+                    await self._connection.close()
+                except Exception:
+                    pass  # Ignore close errors
+                self._connection = None
             raise ConnectionError(f"Failed to connect to SQLite database: {e}")
 
     async def disconnect(self) -> None:
         """Disconnect from SQLite database."""
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+
+        if self._write_task:
+            try:
+                await self.flush()
+            finally:
+                self._write_task.cancel()
+                self._write_task = None
+                self._write_queue = None
+
+        self._user_contexts.clear()
+
+        if self._read_pool:
+            await self._read_pool.close()
+            self._read_pool = None
+
         if self._connection:
             try:
-                await self._connection.close()
-            except Exception:
-                pass  # Ignore close errors
+                await self.flush()
+                # Fold the WAL back into the database and refresh planner
+                # statistics that changed during this session
+                await self._run_maintenance()
+            except Exception as e:
+                logger.warning(f"SQLite shutdown maintenance failed: {e}")
             finally:
+                try:
+                    await self._connection.close()
+                except Exception:
+                    pass  # Ignore close errors
                 self._connection = None
                 self._connected = False
 
@@ -98,12 +371,106 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
         except Exception:
             return False
 
+    @asynccontextmanager
+    async def _reading(self) -> AsyncIterator[aiosqlite.Connection | None]:
+        """Provide a connection for read-only queries.
+
+        Uses the read pool, but falls back to the writer while it holds
+        uncommitted changes, so reads always see this backend's own writes.
+        """
+        if self._read_pool is None or self._connection.in_transaction:
+            yield self._connection
+        else:
+            async with self._read_pool.acquire() as connection:
+                yield connection
+
+    async def _open_connection(self, database: str, **kwargs: Any) -> aiosqlite.Connection:
+        """Open an aiosqlite connection returning rows as mappings."""
+        connection = await aiosqlite.connect(
+            database,
+            timeout=self.config.connection_timeout,
+            iter_chunk_size=512,  # rows fetched per thread hop when iterating
+            cached_statements=256,  # prepared statements kept per connection
+            **kwargs,
+        )
+        connection.row_factory = aiosqlite.Row
+        return connection
+
+    async def _configure_connection(
+        self, connection: aiosqlite.Connection, read_only: bool = False
+    ) -> None:
+        """Apply performance PRAGMAs from the configuration.
+
+        page_size must be set before journal_mode switches to WAL and before
+        the schema is created; it has no effect on an existing database.
+
+        Args:
+            connection: Connection to configure
+            read_only: Skip PRAGMAs that change the database file
+        """
+        config = self.config
+        pragmas = [
+            f"PRAGMA cache_size = {config.cache_size}",
+            f"PRAGMA mmap_size = {config.mmap_size}",
+            f"PRAGMA busy_timeout = {config.busy_timeout}",
+            "PRAGMA temp_store = MEMORY",
+        ]
+        if not read_only:
+            pragmas[:0] = [
+                f"PRAGMA page_size = {config.page_size}",
+                f"PRAGMA journal_mode = {config.journal_mode}",
+                f"PRAGMA synchronous = {config.synchronous}",
+                f"PRAGMA foreign_keys = {'ON' if config.foreign_keys else 'OFF'}",
+                f"PRAGMA wal_autocheckpoint = {config.wal_autocheckpoint}",
+            ]
+        # One script, one trip to the connection thread; no transaction is open yet
+        await connection.executescript(";\n".join(pragmas) + ";")
+
     async def _initialize_schema(self) -> None:
-        """Initialize database schema if needed."""
+        """Initialize database schema if needed.
+
+        The schema revision is kept in PRAGMA user_version, which lives in
+        the database header. A database already at SCHEMA_REVISION skips the
+        schema script entirely; otherwise the script, the data upgrades and
+        the revision bump commit together. The script also reruns when
+        ``enable_fts`` no longer matches the file, creating or dropping the
+        full-text search tables and their sync triggers.
+        """
         try:
-            # Execute schema SQL
-            await self._connection.executescript(get_full_schema_sql())
-            await self._connection.commit()
+            async with self._connection.execute(SCHEMA_STATE_SQL) as cursor:
+                has_messages_fts, has_statistics, revision = await cursor.fetchone()
+
+            enable_fts = self.config.enable_fts
+            if revision < SCHEMA_REVISION or bool(has_messages_fts) != enable_fts:
+                # Apply all DDL in one transaction: a single journal sync instead
+                # of one per statement, and a failed upgrade changes nothing
+                await self._connection.executescript(
+                    f"BEGIN IMMEDIATE;\n{get_full_schema_sql(enable_fts)}"
+                )
+
+                # Index rows stored before the FTS tables existed
+                if enable_fts and not has_messages_fts:
+                    for table in ("messages_fts", "memory_entries_fts"):
+                        await self._connection.execute(
+                            f"INSERT INTO {table}({table}) VALUES ('rebuild')"
+                        )
+
+                if revision < IMPORTANCE_COLUMNS_REVISION:
+                    # Rows written before inserts filled importance/confidence
+                    await self._connection.execute(
+                        """
+                        UPDATE memory_entries SET
+                            importance = coalesce(json_extract(metadata, '$.importance'), 0.0),
+                            confidence = coalesce(json_extract(metadata, '$.confidence'), 0.0)
+                        """
+                    )
+
+                await self._connection.execute(f"PRAGMA user_version = {SCHEMA_REVISION}")
+                await self._connection.commit()
+
+            # Give the query planner index statistics on first use
+            if not has_statistics:
+                await self._connection.execute("ANALYZE")
 
         except Exception as e:
             raise StorageError(f"Failed to initialize SQLite schema: {e}")
@@ -111,60 +478,198 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
     # MemoryInterface implementation
 
     async def store_message(self, message: Message) -> None:
-        """Store a message in the database."""
+        """Store a message in the database.
+
+        With ``async_insert`` enabled the message is buffered and written by
+        the background flusher; call flush() when it must be durable.
+        """
         self.validate_message(message)
 
-        try:
-            data = self.serialize_message(message)
+        if self._write_queue is not None:
+            await self._write_queue.put(message)
+            return
 
-            await self._connection.execute(
-                """
-                INSERT INTO messages (
-                    id, role, content, message_type, timestamp,
-                    metadata, parent_id, conversation_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    data["id"],
-                    data["role"],
-                    data["content"],
-                    data["message_type"],
-                    data["timestamp"],
-                    data["metadata"],
-                    data["parent_id"],
-                    data["conversation_id"],
-                    datetime.now(timezone.utc).isoformat(),
-                ),
-            )
+        async with self._write_lock:
+            try:
+                await self._connection.execute(
+                    INSERT_MESSAGE_SQL,
+                    self._message_row(message, datetime.now(timezone.utc).isoformat()),
+                )
 
-            # Update conversation message count
-            await self._update_conversation_count(message.conversation_id)
+                # Update conversation message count
+                await self._update_conversation_count(message.conversation_id)
 
-            await self._connection.commit()
+                await self._commit()
 
-        except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed" in str(e):
-                raise DuplicateError(f"Message {message.id} already exists")
-            raise StorageError(f"Failed to store message: {e}")
-        except Exception as e:
-            raise StorageError(f"Failed to store message: {e}")
+            except sqlite3.IntegrityError as e:
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateError(f"Message {message.id} already exists")
+                raise StorageError(f"Failed to store message: {e}")
+            except Exception as e:
+                raise StorageError(f"Failed to store message: {e}")
+
+    async def store_messages(self, messages: list[Message]) -> None:
+        """Store several messages in a single transaction.
+
+        Args:
+            messages: Messages to store
+
+        Raises:
+            DuplicateError: If any message already exists (nothing is stored)
+            StorageError: If the messages could not be stored
+        """
+        for message in messages:
+            self.validate_message(message)
+
+        if messages:
+            await self._insert_messages(messages)
+
+    async def _insert_messages(self, messages: list[Message]) -> None:
+        """Insert validated messages atomically (see store_messages)."""
+        async with self._write_lock:
+            savepoint = await self._begin_batch()
+            try:
+                created_at = datetime.now(timezone.utc).isoformat()
+                await self._connection.executemany(
+                    INSERT_MESSAGE_SQL,
+                    [self._message_row(message, created_at) for message in messages],
+                )
+
+                counts: dict[str, int] = {}
+                for message in messages:
+                    counts[message.conversation_id] = counts.get(message.conversation_id, 0) + 1
+                for conversation_id, count in counts.items():
+                    await self._update_conversation_count(conversation_id, count)
+
+                await self._end_batch(savepoint)
+
+            except sqlite3.IntegrityError as e:
+                await self._undo_batch(savepoint)
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateError(f"One or more messages already exist: {e}")
+                raise StorageError(f"Failed to store messages: {e}")
+            except Exception as e:
+                await self._undo_batch(savepoint)
+                raise StorageError(f"Failed to store messages: {e}")
+
+    async def bulk_load(
+        self,
+        messages: list[Message] | None = None,
+        memory_entries: list[MemoryEntry] | None = None,
+    ) -> None:
+        """Import messages and memory entries with deferred full-text indexing.
+
+        The FTS sync triggers are dropped for the duration of the load, so the
+        rows are inserted without per-row index maintenance. The new rows are
+        then indexed with one set-based statement per table and the triggers
+        restored. Everything runs in one transaction while holding the write
+        lock, so no other write can commit the trigger-less state: on failure
+        nothing is imported and the triggers are left in place.
+
+        Args:
+            messages: Messages to import
+            memory_entries: Memory entries to import
+
+        Raises:
+            DuplicateError: If any row already exists (nothing is imported)
+            StorageError: If the import fails
+        """
+        messages = messages or []
+        memory_entries = memory_entries or []
+        for message in messages:
+            self.validate_message(message)
+        for memory_entry in memory_entries:
+            self.validate_memory_entry(memory_entry)
+
+        if not messages and not memory_entries:
+            return
+
+        # Drain buffered inserts, then keep every other writer out until the
+        # triggers are restored; their commits would persist the dropped state
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        async with self._write_lock:
+            if self._connection.in_transaction:
+                await self._connection.commit()
+
+            try:
+                await self._connection.execute("BEGIN IMMEDIATE")
+
+                async with self._connection.execute(
+                    """
+                    SELECT name, sql FROM sqlite_master
+                    WHERE type = 'trigger' AND name IN (
+                        'messages_fts_insert', 'messages_fts_delete', 'messages_fts_update',
+                        'memory_entries_fts_insert', 'memory_entries_fts_delete',
+                        'memory_entries_fts_update'
+                    )
+                """
+                ) as cursor:
+                    triggers = await cursor.fetchall()
+                for trigger in triggers:
+                    await self._connection.execute(f"DROP TRIGGER {trigger['name']}")
+
+                async with self._connection.execute(
+                    "SELECT (SELECT IFNULL(MAX(rowid), 0) FROM messages), "
+                    "(SELECT IFNULL(MAX(rowid), 0) FROM memory_entries)"
+                ) as cursor:
+                    last_message_rowid, last_memory_rowid = await cursor.fetchone()
+
+                if messages:
+                    created_at = datetime.now(timezone.utc).isoformat()
+                    await self._connection.executemany(
+                        INSERT_MESSAGE_SQL,
+                        [self._message_row(message, created_at) for message in messages],
+                    )
+                    counts: dict[str, int] = {}
+                    for message in messages:
+                        counts[message.conversation_id] = counts.get(message.conversation_id, 0) + 1
+                    for conversation_id, count in counts.items():
+                        await self._update_conversation_count(conversation_id, count)
+                    if self.config.enable_fts:
+                        await self._connection.execute(
+                            "INSERT INTO messages_fts(rowid, id, content) "
+                            "SELECT rowid, id, content FROM messages WHERE rowid > ?",
+                            (last_message_rowid,),
+                        )
+
+                if memory_entries:
+                    await self._connection.executemany(
+                        INSERT_MEMORY_SQL, [self._memory_row(entry) for entry in memory_entries]
+                    )
+                    if self.config.enable_fts:
+                        await self._connection.execute(
+                            "INSERT INTO memory_entries_fts(rowid, id, content) "
+                            "SELECT rowid, id, content FROM memory_entries WHERE rowid > ?",
+                            (last_memory_rowid,),
+                        )
+
+                for trigger in triggers:
+                    await self._connection.execute(trigger["sql"])
+
+                await self._connection.commit()
+
+            except sqlite3.IntegrityError as e:
+                await self._connection.rollback()
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateError(f"One or more rows already exist: {e}")
+                raise StorageError(f"Failed to bulk load: {e}")
+            except Exception as e:
+                await self._connection.rollback()
+                raise StorageError(f"Failed to bulk load: {e}")
 
     async def get_message(self, message_id: UUID) -> Message:
         """Retrieve a message by ID."""
         try:
-            async with self._connection.execute(
-                "SELECT * FROM messages WHERE id = ?", (str(message_id),)
+            async with self._reading() as connection, connection.execute(
+                f"SELECT {MESSAGE_COLUMNS} FROM messages WHERE id = ?", (str(message_id),)
             ) as cursor:
                 row = await cursor.fetchone()
 
                 if not row:
                     raise NotFoundError(f"Message {message_id} not found")
 
-                # Convert row to dict
-                columns = [desc[0] for desc in cursor.description]
-                data = dict(zip(columns, row, strict=False))
-
-                return self.deserialize_message(data)
+                return self.deserialize_message(row)
 
         except NotFoundError:
             raise
@@ -183,7 +688,7 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
             raise StorageError("Backend not connected")
 
         try:
-            query_parts = ["SELECT * FROM messages"]
+            query_parts = [f"SELECT {MESSAGE_COLUMNS} FROM messages"]
             params = []
             conditions = []
 
@@ -205,73 +710,121 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
 
             query = " ".join(query_parts)
 
-            messages = []
-            async with self._connection.execute(query, params) as cursor:
-                columns = [desc[0] for desc in cursor.description]
-                async for row in cursor:
-                    data = dict(zip(columns, row, strict=False))
-                    messages.append(self.deserialize_message(data))
+            async with self._reading() as connection, connection.execute(query, params) as cursor:
+                return self.deserialize_messages(await cursor.fetchall())
+
+        except Exception as e:
+            raise StorageError(f"Failed to retrieve messages: {e}")
+
+    async def get_context_window(self, conversation_id: str, limit: int) -> list[Message]:
+        """Retrieve the most recent messages of a conversation.
 
+        Walks the (conversation_id, timestamp) index backwards so only the
+        tail of the conversation is read.
+
+        Args:
+            conversation_id: Conversation ID
+            limit: Maximum number of messages to return
+
+        Returns:
+            Up to ``limit`` latest messages in chronological order
+        """
+        if not self._connection:
+            raise StorageError("Backend not connected")
+
+        try:
+            async with self._reading() as connection, connection.execute(
+                f"""
+                SELECT {MESSAGE_COLUMNS} FROM messages
+                WHERE conversation_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """,
+                (conversation_id, limit),
+            ) as cursor:
+                messages = self.deserialize_messages(await cursor.fetchall())
+
+            messages.reverse()
             return messages
 
         except Exception as e:
-            raise StorageError(f"Failed to retrieve messages: {e}")
+            raise StorageError(f"Failed to retrieve context window: {e}")
 
     async def store_memory(self, memory_entry: MemoryEntry) -> None:
-        """Store a memory entry in the database."""
+        """Store a memory entry in the database.
+
+        With ``async_insert`` enabled the entry is buffered like store_message().
+        """
         self.validate_memory_entry(memory_entry)
 
-        try:
-            data = self.serialize_memory_entry(memory_entry)
+        if self._write_queue is not None:
+            await self._write_queue.put(memory_entry)
+            return
 
-            await self._connection.execute(
-                """
-                INSERT INTO memory_entries (
-                    id, content, memory_type, user_id, conversation_id,
-                    metadata, created_at, updated_at, last_accessed, expires_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    data["id"],
-                    data["content"],
-                    data["memory_type"],
-                    data["user_id"],
-                    data["conversation_id"],
-                    data["metadata"],
-                    data["created_at"],
-                    data["updated_at"],
-                    data["last_accessed"],
-                    data["expires_at"],
-                ),
-            )
+        async with self._write_lock:
+            try:
+                await self._connection.execute(INSERT_MEMORY_SQL, self._memory_row(memory_entry))
 
-            await self._connection.commit()
+                await self._commit()
 
-        except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed" in str(e):
-                raise DuplicateError(f"Memory entry {memory_entry.id} already exists")
-            raise StorageError(f"Failed to store memory: {e}")
-        except Exception as e:
-            raise StorageError(f"Failed to store memory: {e}")
+            except sqlite3.IntegrityError as e:
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateError(f"Memory entry {memory_entry.id} already exists")
+                raise StorageError(f"Failed to store memory: {e}")
+            except Exception as e:
+                raise StorageError(f"Failed to store memory: {e}")
+
+    async def store_memories(self, memory_entries: list[MemoryEntry]) -> None:
+        """Store several memory entries in a single transaction.
+
+        Args:
+            memory_entries: Memory entries to store
+
+        Raises:
+            DuplicateError: If any entry already exists (nothing is stored)
+            StorageError: If the entries could not be stored
+        """
+        for memory_entry in memory_entries:
+            self.validate_memory_entry(memory_entry)
+
+        if memory_entries:
+            await self._insert_memories(memory_entries)
+
+    async def _insert_memories(self, memory_entries: list[MemoryEntry]) -> None:
+        """Insert validated memory entries atomically (see store_memories)."""
+        async with self._write_lock:
+            savepoint = await self._begin_batch()
+            try:
+                await self._connection.executemany(
+                    INSERT_MEMORY_SQL, [self._memory_row(entry) for entry in memory_entries]
+                )
+
+                await self._end_batch(savepoint)
+
+            except sqlite3.IntegrityError as e:
+                await self._undo_batch(savepoint)
+                if "UNIQUE constraint failed" in str(e):
+                    raise DuplicateError(f"One or more memory entries already exist: {e}")
+                raise StorageError(f"Failed to store memories: {e}")
+            except Exception as e:
+                await self._undo_batch(savepoint)
+                raise StorageError(f"Failed to store memories: {e}")
 
     async def get_memory(self, memory_id: UUID) -> MemoryEntry:
         """Retrieve a memory entry by ID."""
         try:
-            async with self._connection.execute(
-                "SELECT * FROM memory_entries WHERE id = ?", (str(memory_id),)
+            async with self._reading() as connection, connection.execute(
+                f"SELECT {MEMORY_COLUMNS} FROM memory_entries WHERE id = ?", (str(memory_id),)
             ) as cursor:
                 row = await cursor.fetchone()
 
                 if not row:
                     raise NotFoundError(f"Memory entry {memory_id} not found")
 
-                columns = [desc[0] for desc in cursor.description]
-                data = dict(zip(columns, row, strict=False))
-
                 # Update last accessed time
                 await self._update_memory_access_time(memory_id)
 
-                return self.deserialize_memory_entry(data)
+                return self._row_to_memory(row)
 
         except NotFoundError:
             raise
@@ -283,48 +836,45 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
         try:
             filters = self.build_memory_query_filters(query)
 
-            # Build dynamic query based on filters
-            query_parts = ["SELECT * FROM memory_entries"]
-            params = []
-            conditions = []
-
+            text = filters.get("query_text")
+            memory_types = filters.get("memory_types") or []
+            tags = filters.get("tags") or []
+            include_expired = filters.get("include_expired", False)
+
+            full_text = bool(text) and self.config.enable_fts
+            params: list[Any] = []
+            if full_text:
+                params.extend((_sanitize_fts(text), query.limit * FTS_OVERFETCH))
+            elif text:
+                params.append(f"%{text}%")
             if filters.get("user_id"):
-                conditions.append("user_id = ?")
                 params.append(filters["user_id"])
-
-            if filters.get("memory_types"):
-                placeholders = ",".join("?" * len(filters["memory_types"]))
-                conditions.append(f"memory_type IN ({placeholders})")
-                params.extend(filters["memory_types"])
-
-            if filters.get("query_text"):
-                # Use FTS for text search
-                conditions.append("id IN (SELECT id FROM memory_entries_fts WHERE content MATCH ?)")
-                params.append(filters["query_text"])
-
-            # Add expiration filter
-            if not filters.get("include_expired", False):
-                conditions.append("(expires_at IS NULL OR expires_at > ?)")
-                params.append(datetime.now(timezone.utc).isoformat())
-
-            if conditions:
-                query_parts.append("WHERE " + " AND ".join(conditions))
-
-            # Add ordering and limits
-            query_parts.append("ORDER BY updated_at DESC")
-
+            params.extend(memory_types)
+            params.extend(tags)
+            for threshold in ("min_importance", "min_confidence"):
+                if filters.get(threshold):
+                    params.append(filters[threshold])
             if filters.get("limit"):
-                query_parts.append("LIMIT ?")
                 params.append(filters["limit"])
 
-            query_sql = " ".join(query_parts)
+            query_sql = _memory_search_sql(
+                full_text,
+                bool(text) and not full_text,
+                bool(filters.get("user_id")),
+                len(memory_types),
+                len(tags),
+                include_expired,
+                bool(filters.get("min_importance")),
+                bool(filters.get("min_confidence")),
+                bool(filters.get("limit")),
+            )
 
             memories = []
-            async with self._connection.execute(query_sql, params) as cursor:
-                columns = [desc[0] for desc in cursor.description]
+            async with self._reading() as connection, connection.execute(
+                query_sql, params
+            ) as cursor:
                 async for row in cursor:
-                    data = dict(zip(columns, row, strict=False))
-                    memories.append(self.deserialize_memory_entry(data))
+                    memories.append(self._row_to_memory(row))
 
             return memories
 
@@ -343,8 +893,18 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
                     set_clauses.append(f"{field} = ?")
                     params.append(value)
                 elif field == "metadata":
+                    embedding = None
+                    if isinstance(value, dict):
+                        embedding = value.get("embedding")
+                        for column in ("importance", "confidence"):
+                            if column in value:
+                                set_clauses.append(f"{column} = ?")
+                                params.append(value[column])
+                        value = json_dumps({k: v for k, v in value.items() if k != "embedding"})
                     set_clauses.append("metadata = ?")
-                    params.append(json.dumps(value) if isinstance(value, dict) else value)
+                    params.append(value)
+                    set_clauses.append("embedding = ?")
+                    params.append(pack_embedding(embedding) if embedding else None)
 
             if not set_clauses:
                 return  # Nothing to update
@@ -357,11 +917,12 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
 
             query = f"UPDATE memory_entries SET {', '.join(set_clauses)} WHERE id = ?"
 
-            async with self._connection.execute(query, params) as cursor:
-                if cursor.rowcount == 0:
-                    raise NotFoundError(f"Memory entry {memory_id} not found")
+            async with self._write_lock:
+                async with self._connection.execute(query, params) as cursor:
+                    if cursor.rowcount == 0:
+                        raise NotFoundError(f"Memory entry {memory_id} not found")
 
-            await self._connection.commit()
+                await self._commit()
 
         except NotFoundError:
             raise
@@ -370,54 +931,51 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
 
     async def delete_memory(self, memory_id: UUID) -> None:
         """Delete a memory entry."""
-        try:
-            async with self._connection.execute(
-                "DELETE FROM memory_entries WHERE id = ?", (str(memory_id),)
-            ) as cursor:
-                if cursor.rowcount == 0:
-                    raise NotFoundError(f"Memory entry {memory_id} not found")
+        async with self._write_lock:
+            try:
+                async with self._connection.execute(
+                    "DELETE FROM memory_entries WHERE id = ?", (str(memory_id),)
+                ) as cursor:
+                    if cursor.rowcount == 0:
+                        raise NotFoundError(f"Memory entry {memory_id} not found")
 
-            await self._connection.commit()
+                await self._commit()
 
-        except NotFoundError:
-            raise
-        except Exception as e:
-            raise StorageError(f"Failed to delete memory: {e}")
+            except NotFoundError:
+                raise
+            except Exception as e:
+                raise StorageError(f"Failed to delete memory: {e}")
 
     async def store_session_context(self, session: SessionContext) -> None:
         """Store session context."""
-        try:
-            data = self.serialize_session_context(session)
-
-            await self._connection.execute(
-                """
-                INSERT OR REPLACE INTO session_contexts (
-                    session_id, user_id, conversation_id, started_at,
-                    ended_at, last_activity, is_active, state, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    data["session_id"],
-                    data["user_id"],
-                    data["conversation_id"],
-                    data["started_at"],
-                    data["ended_at"],
-                    data["last_activity"],
-                    data["is_active"],
-                    data["state"],
-                    data["metadata"],
-                ),
-            )
-
-            await self._connection.commit()
-
-        except Exception as e:
-            raise StorageError(f"Failed to store session context: {e}")
+        async with self._write_lock:
+            try:
+                data = self.serialize_session_context(session)
+
+                await self._connection.execute(
+                    UPSERT_SESSION_SQL,
+                    (
+                        data["session_id"],
+                        data["user_id"],
+                        data["conversation_id"],
+                        data["started_at"],
+                        data["ended_at"],
+                        data["last_activity"],
+                        data["is_active"],
+                        data["state"],
+                        data["metadata"],
+                    ),
+                )
+
+                await self._commit()
+
+            except Exception as e:
+                raise StorageError(f"Failed to store session context: {e}")
 
     async def get_session_context(self, session_id: str) -> SessionContext:
         """Retrieve session context by ID."""
         try:
-            async with self._connection.execute(
+            async with self._reading() as connection, connection.execute(
                 "SELECT * FROM session_contexts WHERE session_id = ?", (session_id,)
             ) as cursor:
                 row = await cursor.fetchone()
@@ -425,38 +983,45 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
                 if not row:
                     raise NotFoundError(f"Session {session_id} not found")
 
-                columns = [desc[0] for desc in cursor.description]
-                data = dict(zip(columns, row, strict=False))
-
-                return self.deserialize_session_context(data)
+                return self.deserialize_session_context(row)
 
         except NotFoundError:
             raise
         except Exception as e:
             raise StorageError(f"Failed to retrieve session context: {e}")
 
-    async def get_context(self, user_id: str, conversation_id: str) -> ConversationContext:
-        """Retrieve conversation context."""
-        try:
-            # Get user context
-            user_context = await self._get_or_create_user_context(user_id)
+    async def get_context(
+        self, user_id: str, conversation_id: str, max_turns: int | None = None
+    ) -> ConversationContext:
+        """Retrieve conversation context.
 
-            # Get or create conversation context
-            conversation_context = await self._get_or_create_conversation_context(
-                conversation_id, user_id
-            )
+        Args:
+            user_id: User ID
+            conversation_id: Conversation ID
+            max_turns: Maximum number of recent messages to include
+                (defaults to ``max_context_messages`` from the config)
 
-            # Get session context (latest active session for this conversation)
-            session_context = await self._get_latest_session_context(user_id, conversation_id)
+        Returns:
+            ConversationContext with the most recent messages in chronological order
+        """
+        try:
+            # The conversation row references the user row, so both are created
+            # (and committed) before the session lookup, which may write as well
+            user_context, conversation_context = await self._get_user_and_conversation_context(
+                user_id, conversation_id
+            )
 
-            # Get recent messages for this conversation
-            messages = await self.get_messages(
-                conversation_id=conversation_id, limit=self.config.max_context_messages
+            # The session lookup and the message window are independent of each other
+            session_context, messages = await asyncio.gather(
+                self._get_latest_session_context(user_id, conversation_id),
+                self.get_context_window(
+                    conversation_id, max_turns or self.config.max_context_messages
+                ),
             )
 
             # Parse metadata from JSON string
             metadata_str = conversation_context.get("metadata", "{}")
-            metadata = json.loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
+            metadata = json_loads(metadata_str) if isinstance(metadata_str, str) else metadata_str
 
             return ConversationContext(
                 conversation_id=conversation_id,
@@ -471,51 +1036,303 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
 
     async def clear_history(self, conversation_id: str) -> None:
         """Clear conversation history."""
-        try:
-            # Delete messages for this conversation
-            await self._connection.execute(
-                "DELETE FROM messages WHERE conversation_id = ?", (conversation_id,)
-            )
+        async with self._write_lock:
+            try:
+                # Delete messages for this conversation
+                await self._connection.execute(
+                    "DELETE FROM messages WHERE conversation_id = ?", (conversation_id,)
+                )
+
+                # Reset conversation message count
+                await self._connection.execute(
+                    """
+                    UPDATE conversation_contexts
+                    SET message_count = 0, updated_at = ?
+                    WHERE conversation_id = ?
+                """,
+                    (datetime.now(timezone.utc).isoformat(), conversation_id),
+                )
+
+                await self._commit()
+
+            except Exception as e:
+                raise StorageError(f"Failed to clear conversation history: {e}")
+
+    async def flush(self) -> None:
+        """Write buffered inserts and commit writes left pending.
+
+        Waits for the ``async_insert`` buffer to drain, then commits any
+        transaction left open because ``auto_commit`` is disabled.
+        """
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        if self._connection and self._connection.in_transaction:
+            async with self._write_lock:
+                await self._connection.commit()
 
-            # Reset conversation message count
-            await self._connection.execute(
-                """
-                UPDATE conversation_contexts
-                SET message_count = 0, updated_at = ?
-                WHERE conversation_id = ?
-            """,
-                (datetime.now(timezone.utc).isoformat(), conversation_id),
-            )
+    async def checkpoint(self, mode: str = "TRUNCATE") -> tuple[int, int, int]:
+        """Checkpoint the WAL into the database file.
+
+        Useful after bulk imports or before backups to keep the WAL bounded
+        without waiting for the maintenance task. Buffered inserts and
+        writes left pending by ``auto_commit`` are committed first.
+
+        Args:
+            mode: PASSIVE, FULL, RESTART or TRUNCATE
+
+        Returns:
+            tuple: ``(busy, log_pages, checkpointed_pages)`` as reported by
+            PRAGMA wal_checkpoint; busy is 1 if readers kept it from finishing
+
+        Raises:
+            ValidationError: If the mode is not a checkpoint mode
+            StorageError: If the checkpoint fails
+        """
+        mode = mode.upper()
+        if mode not in WAL_CHECKPOINT_MODES:
+            raise ValidationError(f"Invalid WAL checkpoint mode: {mode}")
+        if not self._connection:
+            raise StorageError("Backend not connected")
+
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        async with self._write_lock:
+            try:
+                if self._connection.in_transaction:
+                    await self._connection.commit()
+                return await self._checkpoint(mode)
+            except Exception as e:
+                raise StorageError(f"Failed to checkpoint WAL: {e}")
+
+    # Helper methods
 
+    async def _checkpoint(self, mode: str) -> tuple[int, int, int]:
+        """Run PRAGMA wal_checkpoint on the writer; the caller holds the write lock."""
+        async with self._connection.execute(f"PRAGMA wal_checkpoint({mode})") as cursor:
+            return tuple(await cursor.fetchone())
+
+    async def _commit(self) -> None:
+        """Commit the current transaction unless commits are deferred to flush()."""
+        if self.config.auto_commit:
             await self._connection.commit()
 
+    async def _begin_batch(self) -> bool:
+        """Start an atomic batch of writes.
+
+        Inside an already open transaction (deferred commits) the batch runs
+        in a savepoint, so a failed batch leaves earlier pending writes intact.
+
+        Returns:
+            True if a savepoint was opened
+        """
+        if not self._connection.in_transaction:
+            return False
+        await self._connection.execute("SAVEPOINT write_batch")
+        return True
+
+    async def _end_batch(self, savepoint: bool) -> None:
+        """Finish a successful batch started by _begin_batch()."""
+        if savepoint:
+            await self._connection.execute("RELEASE write_batch")
+        await self._commit()
+
+    async def _undo_batch(self, savepoint: bool) -> None:
+        """Discard a failed batch started by _begin_batch()."""
+        if savepoint:
+            await self._connection.execute("ROLLBACK TO write_batch")
+            await self._connection.execute("RELEASE write_batch")
+        else:
+            await self._connection.rollback()
+
+    async def _write_behind(self) -> None:
+        """Drain the ``async_insert`` buffer in batched transactions.
+
+        Waits for a first item, then collects more until
+        ``async_insert_max_rows`` items are buffered or
+        ``async_insert_wait_time`` has passed, and writes them together.
+        """
+        queue = self._write_queue
+        loop = asyncio.get_running_loop()
+        max_rows = self.config.async_insert_max_rows
+        wait_time = self.config.async_insert_wait_time
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + wait_time
+            while len(batch) < max_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write_buffered(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _maintenance(self) -> None:
+        """Run _run_maintenance every ``maintenance_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.config.maintenance_interval)
+            async with self._write_lock:
+                # Checkpointing inside an open transaction would stall on our own lock
+                if self._connection.in_transaction:
+                    continue
+                try:
+                    await self._run_maintenance()
+                except Exception as e:
+                    logger.warning(f"SQLite maintenance failed: {e}")
+
+    async def _run_maintenance(self) -> None:
+        """Truncate the WAL file and let SQLite refresh stale statistics.
+
+        Bursty writes grow the WAL past the autocheckpoint size; readers then
+        scan a long WAL tail until a checkpoint resets it.
+        """
+        if self.config.journal_mode == "WAL":
+            await self._checkpoint("TRUNCATE")
+        await self._connection.execute("PRAGMA optimize")
+
+    async def _write_buffered(self, batch: list[Message | MemoryEntry]) -> None:
+        """Write one buffered batch, isolating rows that fail."""
+        messages = [item for item in batch if isinstance(item, Message)]
+        memories = [item for item in batch if isinstance(item, MemoryEntry)]
+
+        for insert, items in ((self._insert_messages, messages), (self._insert_memories, memories)):
+            if not items:
+                continue
+            try:
+                await insert(items)
+            except Exception:
+                # One bad row fails the whole batch; retry row by row
+                for item in items:
+                    try:
+                        await insert([item])
+                    except Exception as e:
+                        logger.error(f"Dropped buffered write {item.id}: {e}")
+
+    def _message_row(self, message: Message, created_at: str) -> tuple[Any, ...]:
+        """Build the INSERT_MESSAGE_SQL parameters for a message.
+
+        Mirrors serialize_message() but fills the parameter tuple directly,
+        so batches do not allocate an intermediate dict per row.
+        """
+        try:
+            return (
+                str(message.id),
+                message.role.value,
+                message.content,
+                message.message_type.value,
+                message.timestamp.isoformat(),
+                json_dumps(message.metadata) if message.metadata else None,
+                str(message.parent_id) if message.parent_id else None,
+                message.conversation_id,
+                created_at,
+            )
         except Exception as e:
-            raise StorageError(f"Failed to clear conversation history: {e}")
+            raise SerializationError(f"Failed to serialize message: {e}")
 
-    # Helper methods
+    def _memory_row(self, memory_entry: MemoryEntry) -> tuple[Any, ...]:
+        """Build the INSERT_MEMORY_SQL parameters for a memory entry.
+
+        The embedding is stored in its own BLOB column instead of being
+        JSON-encoded as part of the metadata. Importance and confidence are
+        copied into their columns so searches can filter on them in SQL.
+        """
+        try:
+            metadata = memory_entry.metadata
+            return (
+                str(memory_entry.id),
+                memory_entry.content,
+                memory_entry.memory_type.value,
+                memory_entry.user_id,
+                memory_entry.conversation_id,
+                # Encoded by pydantic-core in one pass, without an intermediate dict
+                metadata.model_dump_json(exclude={"embedding"}),
+                memory_entry.created_at.isoformat(),
+                memory_entry.updated_at.isoformat(),
+                memory_entry.last_accessed.isoformat(),
+                memory_entry.expires_at.isoformat() if memory_entry.expires_at else None,
+                metadata.importance,
+                metadata.confidence,
+                pack_embedding(metadata.embedding) if metadata.embedding else None,
+            )
+        except Exception as e:
+            raise SerializationError(f"Failed to serialize memory entry: {e}")
+
+    def _row_to_memory(self, row: Mapping[str, Any]) -> MemoryEntry:
+        """Deserialize a memory_entries row, restoring the embedding from its BLOB."""
+        memory_entry = self.deserialize_memory_entry(row)
+        if row["embedding"] is not None:
+            memory_entry.metadata.embedding = unpack_embedding(row["embedding"])
+        return memory_entry
 
-    async def _update_conversation_count(self, conversation_id: str) -> None:
+    async def _update_conversation_count(self, conversation_id: str, count: int = 1) -> None:
         """Update message count for a conversation."""
         await self._connection.execute(
             """
             UPDATE conversation_contexts
-            SET message_count = message_count + 1, updated_at = ?
+            SET message_count = message_count + ?, updated_at = ?
             WHERE conversation_id = ?
         """,
-            (datetime.now(timezone.utc).isoformat(), conversation_id),
+            (count, datetime.now(timezone.utc).isoformat(), conversation_id),
         )
 
     async def _update_memory_access_time(self, memory_id: UUID) -> None:
         """Update last accessed time for a memory entry."""
-        await self._connection.execute(
-            """
-            UPDATE memory_entries
-            SET last_accessed = ?
-            WHERE id = ?
-        """,
-            (datetime.now(timezone.utc).isoformat(), str(memory_id)),
-        )
-        await self._connection.commit()
+        async with self._write_lock:
+            await self._connection.execute(
+                """
+                UPDATE memory_entries
+                SET last_accessed = ?
+                WHERE id = ?
+            """,
+                (datetime.now(timezone.utc).isoformat(), str(memory_id)),
+            )
+            await self._commit()
+
+    async def _get_user_context(self, user_id: str) -> UserContext:
+        """Get or create a user context through the short-lived user context cache.
+
+        Concurrent calls for the same user share one backend lookup.
+        """
+        ttl = self.config.user_context_cache_ttl
+        if not ttl:
+            return await self._get_or_create_user_context(user_id)
+
+        cached = self._user_contexts.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1].model_copy(deep=True)
+
+        load = self._user_context_loads.get(user_id)
+        if load is None:
+            load = asyncio.ensure_future(self._get_or_create_user_context(user_id))
+            self._user_context_loads[user_id] = load
+            load.add_done_callback(partial(self._user_context_loaded, user_id, ttl))
+
+        # Shielded so one cancelled caller does not fail the others waiting on the load
+        user_context = await asyncio.shield(load)
+        return user_context.model_copy(deep=True)
+
+    def _user_context_loaded(
+        self, user_id: str, ttl: float, load: asyncio.Task[UserContext]
+    ) -> None:
+        """Cache a finished user context load (see _get_user_context)."""
+        del self._user_context_loads[user_id]
+        if load.cancelled() or load.exception() is not None:
+            return
+        # A row created inside a still-open transaction could yet be rolled back
+        if self._connection is None or self._connection.in_transaction:
+            return
+
+        self._user_contexts.pop(user_id, None)
+        if len(self._user_contexts) >= USER_CONTEXT_CACHE_SIZE:
+            del self._user_contexts[next(iter(self._user_contexts))]
+        self._user_contexts[user_id] = (time.monotonic() + ttl, load.result())
 
     async def _get_or_create_user_context(self, user_id: str) -> UserContext:
         """Get or create user context."""
@@ -526,9 +1343,7 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
                 row = await cursor.fetchone()
 
                 if row:
-                    columns = [desc[0] for desc in cursor.description]
-                    data = dict(zip(columns, row, strict=False))
-                    return self.deserialize_user_context(data)
+                    return self.deserialize_user_context(row)
                 else:
                     # Create new user context
                     user_context = UserContext(user_id=user_id)
@@ -539,25 +1354,35 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
             raise StorageError(f"Failed to get/create user context: {e}")
 
     async def _store_user_context(self, user_context: UserContext) -> None:
-        """Store user context."""
+        """Store user context, dropping any cached copy of it."""
         data = self.serialize_user_context(user_context)
+        self._user_contexts.pop(user_context.user_id, None)
 
-        await self._connection.execute(
-            """
-            INSERT OR REPLACE INTO user_contexts (
-                user_id, name, preferences, profile, metadata, created_at, last_active
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                data["user_id"],
-                data["name"],
-                data["preferences"],
-                data["profile"],
-                data["metadata"],
-                data["created_at"],
-                data["last_active"],
-            ),
+        async with self._write_lock:
+            await self._connection.execute(
+                UPSERT_USER_CONTEXT_SQL,
+                (
+                    data["user_id"],
+                    data["name"],
+                    data["preferences"],
+                    data["profile"],
+                    data["metadata"],
+                    data["created_at"],
+                    data["last_active"],
+                ),
+            )
+
+            await self._commit()
+
+    async def _get_user_and_conversation_context(
+        self, user_id: str, conversation_id: str
+    ) -> tuple[UserContext, dict[str, Any]]:
+        """Get or create the user context, then the conversation context."""
+        user_context = await self._get_user_context(user_id)
+        conversation_context = await self._get_or_create_conversation_context(
+            conversation_id, user_id
         )
+        return user_context, conversation_context
 
     async def _get_or_create_conversation_context(
         self, conversation_id: str, user_id: str
@@ -570,19 +1395,21 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
                 row = await cursor.fetchone()
 
                 if row:
-                    columns = [desc[0] for desc in cursor.description]
-                    return dict(zip(columns, row, strict=False))
+                    return dict(row)
                 else:
                     # Create new conversation context
                     now = datetime.now(timezone.utc).isoformat()
-                    await self._connection.execute(
-                        """
-                        INSERT INTO conversation_contexts (
-                            conversation_id, user_id, metadata, created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (conversation_id, user_id, "{}", now, now),
-                    )
+                    async with self._write_lock:
+                        await self._connection.execute(
+                            """
+                            INSERT INTO conversation_contexts (
+                                conversation_id, user_id, metadata, created_at, updated_at
+                            ) VALUES (?, ?, ?, ?, ?)
+                        """,
+                            (conversation_id, user_id, "{}", now, now),
+                        )
+
+                        await self._commit()
 
                     return {
                         "conversation_id": conversation_id,
@@ -612,9 +1439,7 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
                 row = await cursor.fetchone()
 
                 if row:
-                    columns = [desc[0] for desc in cursor.description]
-                    data = dict(zip(columns, row, strict=False))
-                    return self.deserialize_session_context(data)
+                    return self.deserialize_session_context(row)
                 else:
                     # Create new session context
                     session_context = SessionContext(
@@ -636,20 +1461,21 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
 
     async def end_session(self, session_id: str) -> None:
         """End a session by setting it inactive."""
-        try:
-            await self._connection.execute(
-                """
-                UPDATE session_contexts
-                SET is_active = 0, ended_at = ?
-                WHERE session_id = ?
-            """,
-                (datetime.now(timezone.utc).isoformat(), session_id),
-            )
+        async with self._write_lock:
+            try:
+                await self._connection.execute(
+                    """
+                    UPDATE session_contexts
+                    SET is_active = 0, ended_at = ?
+                    WHERE session_id = ?
+                """,
+                    (datetime.now(timezone.utc).isoformat(), session_id),
+                )
 
-            await self._connection.commit()
+                await self._commit()
 
-        except Exception as e:
-            raise StorageError(f"Failed to end session: {e}")
+            except Exception as e:
+                raise StorageError(f"Failed to end session: {e}")
 
     async def get_session(self, session_id: str) -> SessionContext:
         """Get session context by ID (alias for get_session_context)."""
@@ -676,33 +1502,42 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
             raise StorageError("Backend not connected")
 
         try:
-            query_parts = ["SELECT * FROM messages"]
-            params = []
-            conditions = []
-
-            # Add text search condition
-            conditions.append("content LIKE ?")
-            params.append(f"%{query_text}%")
+            if self.config.enable_fts:
+                # Take the best FTS matches first; overfetch when filtering afterwards
+                fts_limit = limit * FTS_OVERFETCH if conversation_id else limit
+                query_parts = [
+                    "WITH fts_matches AS ("
+                    "SELECT rowid, rank FROM messages_fts WHERE messages_fts MATCH ? "
+                    "ORDER BY rank LIMIT ?) "
+                    f"SELECT {MESSAGE_COLUMNS} "
+                    "FROM fts_matches f JOIN messages m ON m.rowid = f.rowid"
+                ]
+                params = [_sanitize_fts(query_text), fts_limit]
+                conditions = []
+                order_by = "ORDER BY f.rank"
+            else:
+                # Without the FTS index fall back to a substring scan
+                query_parts = [f"SELECT {MESSAGE_COLUMNS} FROM messages m"]
+                params = [f"%{query_text}%"]
+                conditions = ["m.content LIKE ?"]
+                order_by = "ORDER BY m.timestamp DESC"
 
             if conversation_id:
-                conditions.append("conversation_id = ?")
+                conditions.append("m.conversation_id = ?")
                 params.append(conversation_id)
 
-            query_parts.append("WHERE " + " AND ".join(conditions))
-            query_parts.append("ORDER BY timestamp DESC")
+            if conditions:
+                query_parts.append("WHERE " + " AND ".join(conditions))
+            query_parts.append(order_by)
             query_parts.append("LIMIT ?")
             params.append(limit)
 
             query_sql = " ".join(query_parts)
 
-            messages = []
-            async with self._connection.execute(query_sql, params) as cursor:
-                columns = [desc[0] for desc in cursor.description]
-                async for row in cursor:
-                    data = dict(zip(columns, row, strict=False))
-                    messages.append(self.deserialize_message(data))
-
-            return messages
+            async with self._reading() as connection, connection.execute(
+                query_sql, params
+            ) as cursor:
+                return self.deserialize_messages(await cursor.fetchall())
 
         except Exception as e:
             raise QueryError(f"Failed to search messages: {e}")
@@ -711,39 +1546,18 @@ class SQLiteMemoryBackend(BaseMemoryBackend):
         """Get database statistics.
 
         Args:
-            user_id: Optional user ID to filter statistics (currently unused)
+            user_id: Optional user ID to restrict the counters to. Messages are
+                attributed to a user through their conversation context.
         """
-        try:
-            stats = {}
+        if user_id:
+            sql, params = USER_STATISTICS_SQL, {"user_id": user_id}
+        else:
+            sql, params = STATISTICS_SQL, {}
 
-            # Get message count
-            async with self._connection.execute("SELECT COUNT(*) FROM messages") as cursor:
-                row = await cursor.fetchone()
-                stats["message_count"] = row[0] if row else 0
-
-            # Get memory count
-            async with self._connection.execute("SELECT COUNT(*) FROM memory_entries") as cursor:
-                row = await cursor.fetchone()
-                stats["memory_count"] = row[0] if row else 0
-
-            # Get user count
-            async with self._connection.execute("SELECT COUNT(*) FROM user_contexts") as cursor:
-                row = await cursor.fetchone()
-                stats["user_count"] = row[0] if row else 0
-
-            # Get conversation count
-            async with self._connection.execute(
-                "SELECT COUNT(*) FROM conversation_contexts"
-            ) as cursor:
-                row = await cursor.fetchone()
-                stats["conversation_count"] = row[0] if row else 0
-
-            # Get active session count
-            async with self._connection.execute(
-                "SELECT COUNT(*) FROM session_contexts WHERE is_active = 1"
-            ) as cursor:
+        try:
+            async with self._reading() as connection, connection.execute(sql, params) as cursor:
                 row = await cursor.fetchone()
-                stats["active_sessions"] = row[0] if row else 0
+            stats = dict(row)
 
             # Get database size
             stats["database_path"] = str(self._db_path)
@@ -0,0 +1,49 @@
+"""
+Read connection pool for the SQLite backend.
+
+aiosqlite runs each connection on its own thread and serializes every
+operation on it, so concurrent reads only overlap when they use different
+connections. In WAL mode readers never block the writer or each other.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+
+class SQLiteReadPool:
+    """Fixed-size pool of read-only aiosqlite connections."""
+
+    def __init__(self, connections: list[aiosqlite.Connection]):
+        """Initialize the pool.
+
+        Args:
+            connections: Open read-only connections owned by the pool
+        """
+        self._connections = connections
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for connection in connections:
+            self._idle.put_nowait(connection)
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Check out a connection for the duration of the block."""
+        connection = await self._idle.get()
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        """Close every connection in the pool."""
+        for connection in self._connections:
+            try:
+                await connection.close()
+            except Exception:
+                pass  # Ignore close errors
+        self._connections = []
@@ -52,6 +52,7 @@ CREATE TABLE IF NOT EXISTS session_contexts (
 );
 
 -- User contexts table for user profiles and preferences
+-- Keyed lookups only, so the rows live in the primary key B-tree itself
 CREATE TABLE IF NOT EXISTS user_contexts (
     user_id TEXT PRIMARY KEY,
     name TEXT,
@@ -60,7 +61,7 @@ CREATE TABLE IF NOT EXISTS user_contexts (
     metadata TEXT NOT NULL DEFAULT '{}',
     created_at TEXT NOT NULL,
     last_active TEXT NOT NULL
-);
+) WITHOUT ROWID;
 
 -- Conversation contexts table for conversation metadata
 CREATE TABLE IF NOT EXISTS conversation_contexts (
@@ -116,24 +117,35 @@ CREATE TABLE IF NOT EXISTS memory_entry_tags (
 -- Indexes for performance optimization
 
 -- Messages indexes
-CREATE INDEX IF NOT EXISTS idx_messages_conversation_id ON messages(conversation_id);
+-- conversation_id lookups are served by the (conversation_id, timestamp) index
+DROP INDEX IF EXISTS idx_messages_conversation_id;
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_timestamp ON messages(conversation_id, timestamp);
 CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp);
 CREATE INDEX IF NOT EXISTS idx_messages_parent_id ON messages(parent_id);
-CREATE INDEX IF NOT EXISTS idx_messages_role ON messages(role);
+-- role has a handful of values; an index on it costs every insert and the
+-- planner prefers the conversation index for real queries
+DROP INDEX IF EXISTS idx_messages_role;
 
 -- Memory entries indexes
-CREATE INDEX IF NOT EXISTS idx_memory_entries_user_id ON memory_entries(user_id);
+-- user_id lookups are served by the (user_id, updated_at) index
+DROP INDEX IF EXISTS idx_memory_entries_user_id;
+CREATE INDEX IF NOT EXISTS idx_memory_entries_user_updated ON memory_entries(user_id, updated_at);
 CREATE INDEX IF NOT EXISTS idx_memory_entries_conversation_id ON memory_entries(conversation_id);
-CREATE INDEX IF NOT EXISTS idx_memory_entries_memory_type ON memory_entries(memory_type);
+-- memory_type filters always come with user_id, served by the index above
+DROP INDEX IF EXISTS idx_memory_entries_memory_type;
 CREATE INDEX IF NOT EXISTS idx_memory_entries_created_at ON memory_entries(created_at);
 CREATE INDEX IF NOT EXISTS idx_memory_entries_updated_at ON memory_entries(updated_at);
 CREATE INDEX IF NOT EXISTS idx_memory_entries_last_accessed ON memory_entries(last_accessed);
-CREATE INDEX IF NOT EXISTS idx_memory_entries_expires_at ON memory_entries(expires_at);
+-- Partial index: only entries that can expire are indexed
+DROP INDEX IF EXISTS idx_memory_entries_expires_at;
+CREATE INDEX IF NOT EXISTS idx_memory_entries_expiring ON memory_entries(expires_at) WHERE expires_at IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_memory_entries_importance ON memory_entries(importance);
 CREATE INDEX IF NOT EXISTS idx_memory_entries_confidence ON memory_entries(confidence);
 
 -- Session contexts indexes
-CREATE INDEX IF NOT EXISTS idx_session_contexts_user_id ON session_contexts(user_id);
+-- user_id lookups are served by the (user_id, conversation_id, last_activity) index
+DROP INDEX IF EXISTS idx_session_contexts_user_id;
+CREATE INDEX IF NOT EXISTS idx_session_contexts_user_conversation ON session_contexts(user_id, conversation_id, last_activity);
 CREATE INDEX IF NOT EXISTS idx_session_contexts_conversation_id ON session_contexts(conversation_id);
 CREATE INDEX IF NOT EXISTS idx_session_contexts_is_active ON session_contexts(is_active);
 CREATE INDEX IF NOT EXISTS idx_session_contexts_last_activity ON session_contexts(last_activity);
@@ -142,7 +154,9 @@ CREATE INDEX IF NOT EXISTS idx_session_contexts_last_activity ON session_context
 CREATE INDEX IF NOT EXISTS idx_user_contexts_last_active ON user_contexts(last_active);
 
 -- Conversation contexts indexes
-CREATE INDEX IF NOT EXISTS idx_conversation_contexts_user_id ON conversation_contexts(user_id);
+-- Covers per-user conversation counts and conversation_id probes without row fetches
+DROP INDEX IF EXISTS idx_conversation_contexts_user_id;
+CREATE INDEX IF NOT EXISTS idx_conversation_contexts_user_conversation ON conversation_contexts(user_id, conversation_id);
 CREATE INDEX IF NOT EXISTS idx_conversation_contexts_created_at ON conversation_contexts(created_at);
 CREATE INDEX IF NOT EXISTS idx_conversation_contexts_updated_at ON conversation_contexts(updated_at);
 
@@ -153,31 +167,6 @@ CREATE INDEX IF NOT EXISTS idx_memory_categories_name ON memory_categories(name)
 -- Memory tags indexes
 CREATE INDEX IF NOT EXISTS idx_memory_tags_name ON memory_tags(name);
 
--- Full-text search support for content
-CREATE VIRTUAL TABLE IF NOT EXISTS memory_entries_fts USING fts5(
-    id UNINDEXED,
-    content,
-    content='memory_entries',
-    content_rowid='rowid'
-);
-
--- Triggers to keep FTS table in sync
-CREATE TRIGGER IF NOT EXISTS memory_entries_fts_insert AFTER INSERT ON memory_entries
-BEGIN
-    INSERT INTO memory_entries_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
-END;
-
-CREATE TRIGGER IF NOT EXISTS memory_entries_fts_delete AFTER DELETE ON memory_entries
-BEGIN
-    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
-END;
-
-CREATE TRIGGER IF NOT EXISTS memory_entries_fts_update AFTER UPDATE ON memory_entries
-BEGIN
-    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
-    INSERT INTO memory_entries_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
-END;
-
 -- Views for common queries
 
 -- Active sessions view
@@ -216,27 +205,107 @@ FROM memory_entries
 GROUP BY user_id, memory_type;
 """
 
+# Full-text search tables and the triggers that keep them in sync
+FTS_SCHEMA_SQL = """
+-- Full-text search support for content
+CREATE VIRTUAL TABLE IF NOT EXISTS memory_entries_fts USING fts5(
+    id UNINDEXED,
+    content,
+    content='memory_entries',
+    content_rowid='rowid'
+);
+
+-- Triggers to keep FTS table in sync
+CREATE TRIGGER IF NOT EXISTS memory_entries_fts_insert AFTER INSERT ON memory_entries
+BEGIN
+    INSERT INTO memory_entries_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS memory_entries_fts_delete AFTER DELETE ON memory_entries
+BEGIN
+    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS memory_entries_fts_update AFTER UPDATE ON memory_entries
+BEGIN
+    INSERT INTO memory_entries_fts(memory_entries_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
+    INSERT INTO memory_entries_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+END;
+
+-- Full-text search support for message content
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    id UNINDEXED,
+    content,
+    content='messages',
+    content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages
+BEGIN
+    INSERT INTO messages_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages
+BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE ON messages
+BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, id, content) VALUES ('delete', old.rowid, old.id, old.content);
+    INSERT INTO messages_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+END;
+"""
+
+# Removes full-text search when it is disabled; the base tables are untouched
+DROP_FTS_SQL = """
+DROP TRIGGER IF EXISTS memory_entries_fts_insert;
+DROP TRIGGER IF EXISTS memory_entries_fts_delete;
+DROP TRIGGER IF EXISTS memory_entries_fts_update;
+DROP TRIGGER IF EXISTS messages_fts_insert;
+DROP TRIGGER IF EXISTS messages_fts_delete;
+DROP TRIGGER IF EXISTS messages_fts_update;
+DROP TABLE IF EXISTS memory_entries_fts;
+DROP TABLE IF EXISTS messages_fts;
+"""
+
 # Version tracking for schema migrations
 SCHEMA_VERSION = "1.0.0"
 
+# Stored in PRAGMA user_version once SCHEMA_SQL has been applied; bump it
+# whenever SCHEMA_SQL changes so existing databases pick the change up
+SCHEMA_REVISION = 3
 
-def get_schema_version_sql() -> str:
-    """Get SQL to create and populate schema version table."""
-    return f"""
+
+SCHEMA_VERSION_SQL = f"""
     CREATE TABLE IF NOT EXISTS schema_version (
         version TEXT PRIMARY KEY,
         applied_at TEXT NOT NULL DEFAULT (datetime('now')),
         description TEXT
-    );
+    ) WITHOUT ROWID;
 
     INSERT OR REPLACE INTO schema_version (version, description)
     VALUES ('{SCHEMA_VERSION}', 'Initial bruno-memory SQLite schema');
     """
 
 
-def get_full_schema_sql() -> str:
-    """Get complete schema SQL including version tracking."""
-    return SCHEMA_SQL + "\n\n" + get_schema_version_sql()
+def get_schema_version_sql() -> str:
+    """Get SQL to create and populate schema version table."""
+    return SCHEMA_VERSION_SQL
+
+
+FULL_SCHEMA_SQL = "\n\n".join((SCHEMA_SQL, FTS_SCHEMA_SQL, SCHEMA_VERSION_SQL))
+FULL_SCHEMA_SQL_WITHOUT_FTS = "\n\n".join((SCHEMA_SQL, DROP_FTS_SQL, SCHEMA_VERSION_SQL))
+
+
+def get_full_schema_sql(enable_fts: bool = True) -> str:
+    """Get complete schema SQL including version tracking.
+
+    Args:
+        enable_fts: Include the full-text search tables and sync triggers.
+            When False they are dropped, so writes skip the trigger work.
+    """
+    return FULL_SCHEMA_SQL if enable_fts else FULL_SCHEMA_SQL_WITHOUT_FTS
 
 
 # Utility functions for schema operations
@@ -264,25 +333,23 @@ def get_view_names() -> list[str]:
 def get_index_names() -> list[str]:
     """Get list of all index names in the schema."""
     return [
-        "idx_messages_conversation_id",
+        "idx_messages_conversation_timestamp",
         "idx_messages_timestamp",
         "idx_messages_parent_id",
-        "idx_messages_role",
-        "idx_memory_entries_user_id",
+        "idx_memory_entries_user_updated",
         "idx_memory_entries_conversation_id",
-        "idx_memory_entries_memory_type",
         "idx_memory_entries_created_at",
         "idx_memory_entries_updated_at",
         "idx_memory_entries_last_accessed",
-        "idx_memory_entries_expires_at",
+        "idx_memory_entries_expiring",
         "idx_memory_entries_importance",
         "idx_memory_entries_confidence",
-        "idx_session_contexts_user_id",
+        "idx_session_contexts_user_conversation",
         "idx_session_contexts_conversation_id",
         "idx_session_contexts_is_active",
         "idx_session_contexts_last_activity",
         "idx_user_contexts_last_active",
-        "idx_conversation_contexts_user_id",
+        "idx_conversation_contexts_user_conversation",
         "idx_conversation_contexts_created_at",
         "idx_conversation_contexts_updated_at",
         "idx_memory_categories_parent_id",
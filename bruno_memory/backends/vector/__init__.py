@@ -2,9 +2,29 @@
 Vector database backends for bruno-memory.
 
 Provides ChromaDB and Qdrant implementations for semantic search.
+Each backend module is imported on first access, so using one vector
+database never requires the other's client library.
 """
 
-from bruno_memory.backends.vector.chromadb_backend import ChromaDBBackend
-from bruno_memory.backends.vector.qdrant_backend import QdrantBackend
+from typing import TYPE_CHECKING
+
+from bruno_memory._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from bruno_memory.backends.vector.chromadb_backend import ChromaDBBackend
+    from bruno_memory.backends.vector.qdrant_backend import QdrantBackend
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChromaDBBackend": "bruno_memory.backends.vector.chromadb_backend",
+        "QdrantBackend": "bruno_memory.backends.vector.qdrant_backend",
+    },
+    # Client package each backend class needs, for install hints
+    {
+        "ChromaDBBackend": "chromadb",
+        "QdrantBackend": "qdrant-client",
+    },
+)
 
 __all__ = ["ChromaDBBackend", "QdrantBackend"]
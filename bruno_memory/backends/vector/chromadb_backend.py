@@ -6,14 +6,14 @@ Provides vector storage and semantic search using ChromaDB.
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import chromadb
 from bruno_core.models import MemoryEntry, MemoryType, Message
-from chromadb.config import Settings
 
+from bruno_memory._lazy import lazy_module
 from bruno_memory.base.base_backend import BaseMemoryBackend
 from bruno_memory.base.config import ChromaDBConfig
 from bruno_memory.exceptions import (
@@ -23,6 +23,8 @@ from bruno_memory.exceptions import (
     QueryError,
 )
 
+chromadb = lazy_module("chromadb")
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,12 +52,10 @@ class ChromaDBBackend(BaseMemoryBackend):
         """Initialize ChromaDB client and collection."""
         try:
             # Create executor for blocking operations
-            from concurrent.futures import ThreadPoolExecutor
-
             self._executor = ThreadPoolExecutor(max_workers=4)
 
             # Initialize ChromaDB client
-            settings = Settings(
+            settings = chromadb.config.Settings(
                 anonymized_telemetry=False,
                 allow_reset=True,
             )
@@ -10,17 +10,8 @@ from typing import Any
 from uuid import uuid4
 
 from bruno_core.models import MemoryEntry, MemoryType, Message
-from qdrant_client import AsyncQdrantClient
-from qdrant_client.models import (
-    Distance,
-    FieldCondition,
-    Filter,
-    MatchValue,
-    PointStruct,
-    Range,
-    VectorParams,
-)
 
+from bruno_memory._lazy import lazy_module
 from bruno_memory.base.base_backend import BaseMemoryBackend
 from bruno_memory.base.config import QdrantConfig
 from bruno_memory.exceptions import (
@@ -29,6 +20,8 @@ from bruno_memory.exceptions import (
     QueryError,
 )
 
+qdrant_client = lazy_module("qdrant_client")
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,14 +41,14 @@ class QdrantBackend(BaseMemoryBackend):
         """Initialize Qdrant backend."""
         super().__init__(config)
         self.config: QdrantConfig = config
-        self._client: AsyncQdrantClient | None = None
+        self._client: qdrant_client.AsyncQdrantClient | None = None
         self._is_connected: bool = False
 
     async def initialize(self) -> None:
         """Initialize Qdrant client and collection."""
         try:
             # Initialize async client
-            self._client = AsyncQdrantClient(
+            self._client = qdrant_client.AsyncQdrantClient(
                 host=self.config.host,
                 port=self.config.port,
                 api_key=self.config.api_key,
@@ -64,11 +57,13 @@ class QdrantBackend(BaseMemoryBackend):
 
             # Map distance metric
             distance_map = {
-                "cosine": Distance.COSINE,
-                "euclidean": Distance.EUCLID,
-                "dot": Distance.DOT,
+                "cosine": qdrant_client.models.Distance.COSINE,
+                "euclidean": qdrant_client.models.Distance.EUCLID,
+                "dot": qdrant_client.models.Distance.DOT,
             }
-            distance = distance_map.get(self.config.distance_metric, Distance.COSINE)
+            distance = distance_map.get(
+                self.config.distance_metric, qdrant_client.models.Distance.COSINE
+            )
 
             # Create collection if it doesn't exist
             try:
@@ -78,7 +73,9 @@ class QdrantBackend(BaseMemoryBackend):
                 # Collection doesn't exist, create it
                 await self._client.create_collection(
                     collection_name=self.config.collection_name,
-                    vectors_config=VectorParams(size=self.config.vector_size, distance=distance),
+                    vectors_config=qdrant_client.models.VectorParams(
+                        size=self.config.vector_size, distance=distance
+                    ),
                 )
                 logger.info(f"Created collection: {self.config.collection_name}")
 
@@ -169,7 +166,9 @@ class QdrantBackend(BaseMemoryBackend):
                 payload.update(metadata)
 
             # Create point
-            point = PointStruct(id=message_id, vector=embedding, payload=payload)
+            point = qdrant_client.models.PointStruct(
+                id=message_id, vector=embedding, payload=payload
+            )
 
             # Upsert point
             await self._client.upsert(collection_name=self.config.collection_name, points=[point])
@@ -189,10 +188,14 @@ class QdrantBackend(BaseMemoryBackend):
 
         try:
             # Build filter
-            query_filter = Filter(
+            query_filter = qdrant_client.models.Filter(
                 must=[
-                    FieldCondition(key="session_id", match=MatchValue(value=session_id)),
-                    FieldCondition(key="type", match=MatchValue(value="message")),
+                    qdrant_client.models.FieldCondition(
+                        key="session_id", match=qdrant_client.models.MatchValue(value=session_id)
+                    ),
+                    qdrant_client.models.FieldCondition(
+                        key="type", match=qdrant_client.models.MatchValue(value="message")
+                    ),
                 ]
             )
 
@@ -255,14 +258,20 @@ class QdrantBackend(BaseMemoryBackend):
 
         try:
             # Build filter
-            must_conditions = [FieldCondition(key="type", match=MatchValue(value="message"))]
+            must_conditions = [
+                qdrant_client.models.FieldCondition(
+                    key="type", match=qdrant_client.models.MatchValue(value="message")
+                )
+            ]
 
             if session_id:
                 must_conditions.append(
-                    FieldCondition(key="session_id", match=MatchValue(value=session_id))
+                    qdrant_client.models.FieldCondition(
+                        key="session_id", match=qdrant_client.models.MatchValue(value=session_id)
+                    )
                 )
 
-            query_filter = Filter(must=must_conditions)
+            query_filter = qdrant_client.models.Filter(must=must_conditions)
 
             # Search
             results = await self._client.search(
@@ -332,7 +341,9 @@ class QdrantBackend(BaseMemoryBackend):
                 payload.update(metadata)
 
             # Create point
-            point = PointStruct(id=memory_id, vector=embedding, payload=payload)
+            point = qdrant_client.models.PointStruct(
+                id=memory_id, vector=embedding, payload=payload
+            )
 
             # Upsert point
             await self._client.upsert(collection_name=self.config.collection_name, points=[point])
@@ -353,15 +364,23 @@ class QdrantBackend(BaseMemoryBackend):
         try:
             # Build filter
             must_conditions = [
-                FieldCondition(key="type", match=MatchValue(value="memory")),
-                FieldCondition(key="importance", range=Range(gte=min_importance)),
+                qdrant_client.models.FieldCondition(
+                    key="type", match=qdrant_client.models.MatchValue(value="memory")
+                ),
+                qdrant_client.models.FieldCondition(
+                    key="importance", range=qdrant_client.models.Range(gte=min_importance)
+                ),
             ]
 
             if tags:
                 for tag in tags:
-                    must_conditions.append(FieldCondition(key="tags", match=MatchValue(value=tag)))
+                    must_conditions.append(
+                        qdrant_client.models.FieldCondition(
+                            key="tags", match=qdrant_client.models.MatchValue(value=tag)
+                        )
+                    )
 
-            query_filter = Filter(must=must_conditions)
+            query_filter = qdrant_client.models.Filter(must=must_conditions)
 
             # Scroll through results
             points, _ = await self._client.scroll(
@@ -407,10 +426,14 @@ class QdrantBackend(BaseMemoryBackend):
 
         try:
             # Build filter
-            query_filter = Filter(
+            query_filter = qdrant_client.models.Filter(
                 must=[
-                    FieldCondition(key="type", match=MatchValue(value="memory")),
-                    FieldCondition(key="importance", range=Range(gte=min_importance)),
+                    qdrant_client.models.FieldCondition(
+                        key="type", match=qdrant_client.models.MatchValue(value="memory")
+                    ),
+                    qdrant_client.models.FieldCondition(
+                        key="importance", range=qdrant_client.models.Range(gte=min_importance)
+                    ),
                 ]
             )
 
@@ -446,10 +469,14 @@ class QdrantBackend(BaseMemoryBackend):
 
         try:
             # Build filter
-            query_filter = Filter(
+            query_filter = qdrant_client.models.Filter(
                 must=[
-                    FieldCondition(key="session_id", match=MatchValue(value=session_id)),
-                    FieldCondition(key="type", match=MatchValue(value="message")),
+                    qdrant_client.models.FieldCondition(
+                        key="session_id", match=qdrant_client.models.MatchValue(value=session_id)
+                    ),
+                    qdrant_client.models.FieldCondition(
+                        key="type", match=qdrant_client.models.MatchValue(value="message")
+                    ),
                 ]
             )
 
@@ -473,7 +500,7 @@ class QdrantBackend(BaseMemoryBackend):
             # Delete all points
             await self._client.delete(
                 collection_name=self.config.collection_name,
-                points_selector=Filter(must=[]),  # Empty filter matches all
+                points_selector=qdrant_client.models.Filter(must=[]),  # Empty filter matches all
             )
 
             logger.info("Qdrant collection cleared")
@@ -532,11 +559,9 @@ class QdrantBackend(BaseMemoryBackend):
     async def delete_memory(self, memory_id: str) -> None:
         """Delete a specific memory."""
         try:
-            from qdrant_client.models import PointIdsList
-
             await self._client.delete(
                 collection_name=self.config.collection_name,
-                points_selector=PointIdsList(points=[memory_id]),
+                points_selector=qdrant_client.models.PointIdsList(points=[memory_id]),
             )
             logger.debug(f"Deleted memory {memory_id}")
         except Exception as e:
@@ -6,10 +6,13 @@ with proper model handling and serialization.
 """
 
 import json
+import sys
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Mapping
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
-from uuid import UUID
 
 from bruno_core.interfaces import MemoryInterface
 from bruno_core.models import (
@@ -19,7 +22,6 @@ from bruno_core.models import (
     MemoryType,
     Message,
     MessageRole,
-    MessageType,
     SessionContext,
 )
 from bruno_core.models.context import UserContext
@@ -28,10 +30,100 @@ from bruno_core.models.memory import MemoryMetadata
 from ..exceptions import SerializationError, ValidationError
 from .config import MemoryConfig
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The encoder is chosen once at import, so each call is a single C call
+# instead of a flag check plus module attribute lookups
+if ORJSON_AVAILABLE:
+    _dumps = orjson.dumps
+    _DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def json_dumps(value: Any) -> str:
+        """Encode a value as compact JSON text with orjson.
+
+        Args:
+            value: JSON-serializable value
+
+        Returns:
+            JSON document as a string
+        """
+        return _dumps(value, option=_DUMPS_OPTIONS).decode()
+
+    json_loads = orjson.loads
+else:
+    _dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+    def json_dumps(value: Any) -> str:
+        """Encode a value as compact JSON text with the standard library.
+
+        Args:
+            value: JSON-serializable value
+
+        Returns:
+            JSON document as a string
+        """
+        return _dumps(value)
+
+    json_loads = json.loads
+
+
+def pack_embedding(vector: list[float]) -> bytes:
+    """Pack an embedding vector as float32 bytes for a BLOB/BYTEA column.
+
+    A 1536-dim vector takes 6 KB this way instead of ~20 KB of JSON text.
+    """
+    return array("f", vector).tobytes()
+
+
+def unpack_embedding(blob: bytes) -> list[float]:
+    """Unpack an embedding vector stored by pack_embedding."""
+    return array("f", blob).tolist()
+
+
+# Rows often repeat timestamp strings (created_at == updated_at on insert,
+# batch-imported rows); datetimes are immutable, so parsed values are shared
+_parse_iso = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+
+# Stored for empty dict columns, and recognized on read without parsing
+EMPTY_JSON_OBJECT = "{}"
+
+
+def _dumps_object(value: dict[str, Any] | None) -> str:
+    """Encode a dict column, skipping the encoder for the common empty case."""
+    return json_dumps(value) if value else EMPTY_JSON_OBJECT
+
+
+def _loads_object(text: str | bytes | None) -> dict[str, Any]:
+    """Decode a dict column, skipping the parser for NULL, "" and "{}"."""
+    return json_loads(text) if text and text != EMPTY_JSON_OBJECT else {}
+
+
+# Config fields whose names contain any of these are left out of get_backend_info()
+SECRET_FIELD_MARKERS = ("password", "secret", "token", "api_key")
+
+
+def _intern(value: str | None) -> str | None:
+    """Share one string object for ids repeated across many rows.
+
+    Drivers return a fresh string per row, so a long conversation would
+    otherwise hold one copy of its conversation_id per message.
+    """
+    return sys.intern(value) if value else value
+
 
 class BaseMemoryBackend(MemoryInterface, ABC):
     """Abstract base class for all memory backend implementations."""
 
+    # bruno_core's MemoryInterface has no __slots__, so instances keep a
+    # __dict__ for subclass state; the attributes every backend has use slots
+    __slots__ = ("config", "_connected", "_safe_config")
+
     def __init__(self, config: MemoryConfig):
         """Initialize base backend with configuration.
 
@@ -40,6 +132,12 @@ class BaseMemoryBackend(MemoryInterface, ABC):
         """
         self.config = config
         self._connected = False
+        # Scrubbed once here, so get_backend_info() stays cheap for health endpoints
+        self._safe_config = {
+            name: value
+            for name, value in config.model_dump().items()
+            if not any(marker in name.lower() for marker in SECRET_FIELD_MARKERS)
+        }
 
     # Abstract connection methods that must be implemented
     @abstractmethod
@@ -70,7 +168,8 @@ class BaseMemoryBackend(MemoryInterface, ABC):
         if not isinstance(message, Message):
             raise ValidationError(f"Expected Message instance, got {type(message)}")
 
-        if not message.content or len(message.content.strip()) == 0:
+        # isspace() never copies; strip() copies content that has edge whitespace
+        if not message.content or message.content.isspace():
             raise ValidationError("Message content cannot be empty")
 
         if not isinstance(message.role, MessageRole):
@@ -88,13 +187,13 @@ class BaseMemoryBackend(MemoryInterface, ABC):
         if not isinstance(memory_entry, MemoryEntry):
             raise ValidationError(f"Expected MemoryEntry instance, got {type(memory_entry)}")
 
-        if not memory_entry.content or len(memory_entry.content.strip()) == 0:
+        if not memory_entry.content or memory_entry.content.isspace():
             raise ValidationError("Memory content cannot be empty")
 
         if not isinstance(memory_entry.memory_type, MemoryType):
             raise ValidationError(f"Invalid memory type: {memory_entry.memory_type}")
 
-        if not memory_entry.user_id or len(memory_entry.user_id.strip()) == 0:
+        if not memory_entry.user_id or memory_entry.user_id.isspace():
             raise ValidationError("Memory entry user_id cannot be empty")
 
     # Model serialization utilities for database storage
@@ -114,36 +213,51 @@ class BaseMemoryBackend(MemoryInterface, ABC):
                 "content": message.content,
                 "message_type": message.message_type.value,
                 "timestamp": message.timestamp.isoformat(),
-                "metadata": json.dumps(message.metadata) if message.metadata else None,
+                "metadata": json_dumps(message.metadata) if message.metadata else None,
                 "parent_id": str(message.parent_id) if message.parent_id else None,
                 "conversation_id": message.conversation_id,
             }
         except Exception as e:
             raise SerializationError(f"Failed to serialize message: {e}")
 
-    def deserialize_message(self, data: dict[str, Any]) -> Message:
+    def deserialize_message(self, data: Mapping[str, Any]) -> Message:
         """Deserialize database data to Message instance.
 
         Args:
-            data: Dictionary from database
+            data: Row mapping from database
 
         Returns:
             Message instance
         """
         try:
+            # Id and enum strings are handed to pydantic-core, which parses
+            # them natively; uuid.UUID(...) and MessageRole(...) would parse
+            # them in Python first
             return Message(
-                id=UUID(data["id"]),
-                role=MessageRole(data["role"]),
+                id=data["id"],
+                role=data["role"],
                 content=data["content"],
-                message_type=MessageType(data["message_type"]),
-                timestamp=datetime.fromisoformat(data["timestamp"]),
-                metadata=json.loads(data["metadata"]) if data["metadata"] else {},
-                parent_id=UUID(data["parent_id"]) if data["parent_id"] else None,
-                conversation_id=data["conversation_id"],
+                message_type=data["message_type"],
+                timestamp=_parse_iso(data["timestamp"]),
+                metadata=_loads_object(data["metadata"]),
+                parent_id=data["parent_id"] or None,
+                conversation_id=_intern(data["conversation_id"]),
             )
         except Exception as e:
             raise SerializationError(f"Failed to deserialize message: {e}")
 
+    def deserialize_messages(self, rows: Iterable[Mapping[str, Any]]) -> list[Message]:
+        """Deserialize a result set of message rows.
+
+        Args:
+            rows: Row mappings from database
+
+        Returns:
+            Message instances in row order
+        """
+        deserialize = self.deserialize_message
+        return [deserialize(row) for row in rows]
+
     def serialize_memory_entry(self, memory_entry: MemoryEntry) -> dict[str, Any]:
         """Serialize MemoryEntry to database-compatible dictionary.
 
@@ -160,7 +274,7 @@ class BaseMemoryBackend(MemoryInterface, ABC):
                 "memory_type": memory_entry.memory_type.value,
                 "user_id": memory_entry.user_id,
                 "conversation_id": memory_entry.conversation_id,
-                "metadata": json.dumps(memory_entry.metadata.model_dump()),
+                "metadata": memory_entry.metadata.model_dump_json(),
                 "created_at": memory_entry.created_at.isoformat(),
                 "updated_at": memory_entry.updated_at.isoformat(),
                 "last_accessed": memory_entry.last_accessed.isoformat(),
@@ -171,32 +285,34 @@ class BaseMemoryBackend(MemoryInterface, ABC):
         except Exception as e:
             raise SerializationError(f"Failed to serialize memory entry: {e}")
 
-    def deserialize_memory_entry(self, data: dict[str, Any]) -> MemoryEntry:
+    def deserialize_memory_entry(self, data: Mapping[str, Any]) -> MemoryEntry:
         """Deserialize database data to MemoryEntry instance.
 
         Args:
-            data: Dictionary from database
+            data: Row mapping from database
 
         Returns:
             MemoryEntry instance
         """
         try:
-            metadata_dict = json.loads(data["metadata"]) if data["metadata"] else {}
-            metadata = MemoryMetadata.model_validate(metadata_dict)
+            # Parsed and validated by pydantic-core in one pass, without an intermediate dict
+            metadata = (
+                MemoryMetadata.model_validate_json(data["metadata"])
+                if data["metadata"]
+                else MemoryMetadata()
+            )
 
             return MemoryEntry(
-                id=UUID(data["id"]),
+                id=data["id"],
                 content=data["content"],
-                memory_type=MemoryType(data["memory_type"]),
-                user_id=data["user_id"],
-                conversation_id=data["conversation_id"],
+                memory_type=data["memory_type"],
+                user_id=_intern(data["user_id"]),
+                conversation_id=_intern(data["conversation_id"]),
                 metadata=metadata,
-                created_at=datetime.fromisoformat(data["created_at"]),
-                updated_at=datetime.fromisoformat(data["updated_at"]),
-                last_accessed=datetime.fromisoformat(data["last_accessed"]),
-                expires_at=(
-                    datetime.fromisoformat(data["expires_at"]) if data["expires_at"] else None
-                ),
+                created_at=_parse_iso(data["created_at"]),
+                updated_at=_parse_iso(data["updated_at"]),
+                last_accessed=_parse_iso(data["last_accessed"]),
+                expires_at=(_parse_iso(data["expires_at"]) if data["expires_at"] else None),
             )
         except Exception as e:
             raise SerializationError(f"Failed to deserialize memory entry: {e}")
@@ -219,17 +335,17 @@ class BaseMemoryBackend(MemoryInterface, ABC):
                 "ended_at": session.ended_at.isoformat() if session.ended_at else None,
                 "last_activity": session.last_activity.isoformat(),
                 "is_active": session.is_active,
-                "state": json.dumps(session.state),
-                "metadata": json.dumps(session.metadata),
+                "state": _dumps_object(session.state),
+                "metadata": _dumps_object(session.metadata),
             }
         except Exception as e:
             raise SerializationError(f"Failed to serialize session context: {e}")
 
-    def deserialize_session_context(self, data: dict[str, Any]) -> SessionContext:
+    def deserialize_session_context(self, data: Mapping[str, Any]) -> SessionContext:
         """Deserialize database data to SessionContext instance.
 
         Args:
-            data: Dictionary from database
+            data: Row mapping from database
 
         Returns:
             SessionContext instance
@@ -237,14 +353,14 @@ class BaseMemoryBackend(MemoryInterface, ABC):
         try:
             return SessionContext(
                 session_id=data["session_id"],
-                user_id=data["user_id"],
-                conversation_id=data["conversation_id"],
-                started_at=datetime.fromisoformat(data["started_at"]),
-                ended_at=datetime.fromisoformat(data["ended_at"]) if data["ended_at"] else None,
-                last_activity=datetime.fromisoformat(data["last_activity"]),
+                user_id=_intern(data["user_id"]),
+                conversation_id=_intern(data["conversation_id"]),
+                started_at=_parse_iso(data["started_at"]),
+                ended_at=_parse_iso(data["ended_at"]) if data["ended_at"] else None,
+                last_activity=_parse_iso(data["last_activity"]),
                 is_active=bool(data["is_active"]),
-                state=json.loads(data["state"]) if data["state"] else {},
-                metadata=json.loads(data["metadata"]) if data["metadata"] else {},
+                state=_loads_object(data["state"]),
+                metadata=_loads_object(data["metadata"]),
             )
         except Exception as e:
             raise SerializationError(f"Failed to deserialize session context: {e}")
@@ -262,33 +378,33 @@ class BaseMemoryBackend(MemoryInterface, ABC):
             return {
                 "user_id": user.user_id,
                 "name": user.name,
-                "preferences": json.dumps(user.preferences),
-                "profile": json.dumps(user.profile),
-                "metadata": json.dumps(user.metadata),
+                "preferences": _dumps_object(user.preferences),
+                "profile": _dumps_object(user.profile),
+                "metadata": _dumps_object(user.metadata),
                 "created_at": user.created_at.isoformat(),
                 "last_active": user.last_active.isoformat(),
             }
         except Exception as e:
             raise SerializationError(f"Failed to serialize user context: {e}")
 
-    def deserialize_user_context(self, data: dict[str, Any]) -> UserContext:
+    def deserialize_user_context(self, data: Mapping[str, Any]) -> UserContext:
         """Deserialize database data to UserContext instance.
 
         Args:
-            data: Dictionary from database
+            data: Row mapping from database
 
         Returns:
             UserContext instance
         """
         try:
             return UserContext(
-                user_id=data["user_id"],
+                user_id=_intern(data["user_id"]),
                 name=data["name"],
-                preferences=json.loads(data["preferences"]) if data["preferences"] else {},
-                profile=json.loads(data["profile"]) if data["profile"] else {},
-                metadata=json.loads(data["metadata"]) if data["metadata"] else {},
-                created_at=datetime.fromisoformat(data["created_at"]),
-                last_active=datetime.fromisoformat(data["last_active"]),
+                preferences=_loads_object(data["preferences"]),
+                profile=_loads_object(data["profile"]),
+                metadata=_loads_object(data["metadata"]),
+                created_at=_parse_iso(data["created_at"]),
+                last_active=_parse_iso(data["last_active"]),
             )
         except Exception as e:
             raise SerializationError(f"Failed to deserialize user context: {e}")
@@ -352,6 +468,19 @@ class BaseMemoryBackend(MemoryInterface, ABC):
             metadata={},
         )
 
+    def get_backend_info(self) -> dict[str, Any]:
+        """Describe the backend for health and metrics endpoints.
+
+        Returns:
+            Dictionary with the backend class, connection state and the
+            configuration as given at construction, without credentials
+        """
+        return {
+            "backend": type(self).__name__,
+            "connected": self._connected,
+            "config": dict(self._safe_config),
+        }
+
     # Connection state properties
     @property
     def is_connected(self) -> bool:
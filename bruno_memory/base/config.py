@@ -31,12 +31,47 @@ class SQLiteConfig(MemoryConfig):
     enable_fts: bool = Field(default=True, description="Enable full-text search")
     synchronous: str = Field(default="NORMAL", description="SQLite synchronous mode")
     journal_mode: str = Field(default="WAL", description="SQLite journal mode")
-    cache_size: int = Field(default=2000, description="SQLite cache size in pages")
+    cache_size: int = Field(
+        default=-65536, description="SQLite cache size (pages, or KiB if negative)"
+    )
+    page_size: int = Field(
+        default=65536, description="SQLite page size in bytes (applies to new databases)"
+    )
+    mmap_size: int = Field(default=268435456, description="SQLite memory-mapped I/O size in bytes")
+    busy_timeout: int = Field(default=5000, description="SQLite busy timeout in milliseconds")
     foreign_keys: bool = Field(default=True, description="Enable foreign key constraints")
+    wal_autocheckpoint: int = Field(
+        default=10000, ge=0, description="WAL pages written before an automatic checkpoint"
+    )
+    maintenance_interval: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds between WAL truncation and PRAGMA optimize runs (0 disables)",
+    )
     connection_timeout: int = Field(default=30, description="Connection timeout in seconds")
+    read_pool_size: int = Field(
+        default=4, ge=0, description="Read-only connections used for queries in WAL mode"
+    )
+    auto_commit: bool = Field(
+        default=True, description="Commit after every write (otherwise call flush())"
+    )
+    async_insert: bool = Field(
+        default=False, description="Buffer single-row inserts and write them in batches"
+    )
+    async_insert_max_rows: int = Field(
+        default=1000, ge=1, description="Maximum buffered inserts written per batch"
+    )
+    async_insert_wait_time: float = Field(
+        default=0.05, gt=0, description="Seconds to collect buffered inserts before writing"
+    )
     max_context_messages: int = Field(
         default=100, description="Maximum messages to include in context"
     )
+    user_context_cache_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds get_context reuses a loaded user context (0 disables)",
+    )
 
     @field_validator("database_path")
     @classmethod
@@ -62,6 +97,13 @@ class SQLiteConfig(MemoryConfig):
             raise ValueError(f"journal_mode must be one of {valid_modes}")
         return v
 
+    @field_validator("page_size")
+    @classmethod
+    def validate_page_size(cls, v):
+        if not 512 <= v <= 65536 or v & (v - 1):
+            raise ValueError("page_size must be a power of two between 512 and 65536")
+        return v
+
     def get_connection_string(self) -> str:
         """Generate SQLite connection string."""
         return f"sqlite:///{self.database_path}"
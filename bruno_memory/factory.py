@@ -5,10 +5,12 @@ Provides a centralized factory pattern for creating memory backends
 with proper configuration validation and type safety.
 """
 
+import functools
+import importlib
 import inspect
 import logging
 import os
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
 
 try:
     from dotenv import load_dotenv
@@ -22,6 +24,14 @@ from .exceptions import BackendNotFoundError, ConfigurationError, ValidationErro
 
 logger = logging.getLogger(__name__)
 
+ENTRY_POINT_GROUP = "bruno_memory.backends"
+
+
+@functools.lru_cache(maxsize=1)
+def _backend_entry_points() -> tuple[EntryPoint, ...]:
+    """Scan installed distributions for backend entry points once per process."""
+    return tuple(entry_points(group=ENTRY_POINT_GROUP))
+
 
 class MemoryBackendFactory:
     """Factory for creating memory backend instances."""
@@ -34,7 +44,10 @@ class MemoryBackendFactory:
             load_env: Load environment variables from .env file
         """
         self._backends: dict[str, type[BaseMemoryBackend]] = {}
+        self._lazy_backends: dict[str, str] = {}
         self._config_types: dict[str, type[MemoryConfig]] = CONFIG_CLASSES.copy()
+        # Resolved (backend class, config class) pairs, cleared on registry changes
+        self._resolved: dict[str, tuple[type[BaseMemoryBackend], type[MemoryConfig] | None]] = {}
 
         if load_env and DOTENV_AVAILABLE:
             load_dotenv()
@@ -59,6 +72,12 @@ class MemoryBackendFactory:
         Raises:
             ValidationError: If backend class is invalid
         """
+        # Re-registering the same pair (module reloads, plugin rescans) is a no-op
+        if self._backends.get(name) is backend_class and (
+            config_class is None or self._config_types.get(name) is config_class
+        ):
+            return
+
         if not inspect.isclass(backend_class):
             raise ValidationError(f"Backend must be a class, got {type(backend_class)}")
 
@@ -69,6 +88,8 @@ class MemoryBackendFactory:
             )
 
         self._backends[name] = backend_class
+        self._lazy_backends.pop(name, None)
+        self._resolved.pop(name, None)
 
         if config_class:
             if not issubclass(config_class, MemoryConfig):
@@ -77,6 +98,42 @@ class MemoryBackendFactory:
                 )
             self._config_types[name] = config_class
 
+    def register_lazy_backend(
+        self,
+        name: str,
+        import_path: str,
+        config_class: type[MemoryConfig] | None = None,
+    ) -> None:
+        """Register a backend by import path without importing it.
+
+        The backend module is imported and registered on first request,
+        so unused backends never load their driver dependencies.
+
+        Args:
+            name: Backend name (e.g., 'sqlite', 'postgresql')
+            import_path: Location of the backend class as 'module:ClassName'
+            config_class: Optional configuration class override
+
+        Raises:
+            ValidationError: If import path or config class is invalid
+        """
+        module_name, _, class_name = import_path.partition(":")
+        if not module_name or not class_name:
+            raise ValidationError(
+                f"Backend import path must look like 'module:ClassName', got {import_path!r}"
+            )
+
+        if config_class:
+            if not issubclass(config_class, MemoryConfig):
+                raise ValidationError(
+                    f"Config class must inherit from MemoryConfig, " f"got {config_class.__name__}"
+                )
+            self._config_types[name] = config_class
+
+        if name not in self._backends:
+            self._lazy_backends[name] = import_path
+        self._resolved.pop(name, None)
+
     def unregister_backend(self, name: str) -> None:
         """Unregister a memory backend implementation.
 
@@ -84,34 +141,69 @@ class MemoryBackendFactory:
             name: Backend name to unregister
         """
         self._backends.pop(name, None)
+        self._lazy_backends.pop(name, None)
         self._config_types.pop(name, None)
+        self._resolved.pop(name, None)
+
+    def _resolve_backend(self, name: str) -> type[BaseMemoryBackend]:
+        """Return the backend class for a name, importing lazy backends on demand.
+
+        Args:
+            name: Backend name
+
+        Returns:
+            Backend class
+
+        Raises:
+            BackendNotFoundError: If backend is not registered or cannot be imported
+        """
+        backend_class = self._backends.get(name)
+        if backend_class is not None:
+            return backend_class
 
-    def discover_backends(self) -> None:
+        import_path = self._lazy_backends.get(name)
+        if import_path is None:
+            available = list(self._backends.keys()) + list(self._lazy_backends.keys())
+            raise BackendNotFoundError(
+                f"Backend type '{name}' not found. " f"Available backends: {available}"
+            )
+
+        module_name, _, class_name = import_path.partition(":")
+        try:
+            backend_class = getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError) as e:
+            raise BackendNotFoundError(f"Backend '{name}' could not be imported: {e}")
+
+        self.register_backend(name, backend_class)
+        return backend_class
+
+    def discover_backends(self, refresh: bool = False) -> None:
         """Discover and register backends via entry points.
 
         Looks for entry points in the 'bruno_memory.backends' group.
-        Each entry point should provide a backend class.
+        Each entry point should provide a backend class, which is only
+        imported when the backend is first requested. The entry point scan
+        is cached per process.
+
+        Args:
+            refresh: Rescan installed distributions instead of using the cache
         """
+        if refresh:
+            _backend_entry_points.cache_clear()
+
         try:
-            eps = entry_points()
-            # Handle both old and new entry_points() API
-            if hasattr(eps, "select"):
-                # Python 3.10+ API
-                backend_entries = eps.select(group="bruno_memory.backends")
-            else:
-                # Python 3.9 API
-                backend_entries = eps.get("bruno_memory.backends", [])
-
-            for ep in backend_entries:
-                try:
-                    backend_class = ep.load()
-                    # Entry point name is the backend name
-                    self.register_backend(ep.name, backend_class)
-                    logger.info(f"Discovered backend via entry point: {ep.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to load backend entry point {ep.name}: {e}")
+            backend_entries = _backend_entry_points()
         except Exception as e:
             logger.warning(f"Backend discovery failed: {e}")
+            return
+
+        for ep in backend_entries:
+            try:
+                # Entry point name is the backend name; loaded on first request
+                self.register_lazy_backend(ep.name, ep.value)
+                logger.info(f"Discovered backend via entry point: {ep.name}")
+            except Exception as e:
+                logger.warning(f"Failed to load backend entry point {ep.name}: {e}")
 
     def list_backends(self) -> dict[str, str]:
         """List all registered backend implementations.
@@ -119,7 +211,10 @@ class MemoryBackendFactory:
         Returns:
             Dictionary mapping backend names to class names
         """
-        return {name: cls.__name__ for name, cls in self._backends.items()}
+        backends = {name: cls.__name__ for name, cls in self._backends.items()}
+        for name, import_path in self._lazy_backends.items():
+            backends[name] = import_path.rpartition(":")[2]
+        return backends
 
     def create_config(self, backend_type: str, **kwargs) -> MemoryConfig:
         """Create a configuration instance for the specified backend type.
@@ -135,13 +230,7 @@ class MemoryBackendFactory:
             BackendNotFoundError: If backend type is not registered
             ConfigurationError: If configuration creation fails
         """
-        if backend_type not in self._config_types:
-            available = list(self._config_types.keys())
-            raise BackendNotFoundError(
-                f"Backend type '{backend_type}' not found. " f"Available backends: {available}"
-            )
-
-        config_class = self._config_types[backend_type]
+        config_class = self.get_config_class(backend_type)
 
         try:
             return config_class(**kwargs)
@@ -165,25 +254,25 @@ class MemoryBackendFactory:
             BackendNotFoundError: If backend type is not registered
             ConfigurationError: If configuration is invalid
         """
-        if backend_type not in self._backends:
-            available = list(self._backends.keys())
-            raise BackendNotFoundError(
-                f"Backend type '{backend_type}' not found. " f"Available backends: {available}"
+        pair = self._resolved.get(backend_type)
+        if pair is None:
+            pair = (
+                self._resolve_backend(backend_type),
+                self._config_types.get(backend_type),
             )
+            self._resolved[backend_type] = pair
+        backend_class, expected_type = pair
 
         # Create or validate configuration
         if config is None:
             config = self.create_config(backend_type, **config_kwargs)
         else:
-            expected_type = self._config_types.get(backend_type)
             if expected_type and not isinstance(config, expected_type):
                 raise ConfigurationError(
                     f"Invalid config type for {backend_type}. "
                     f"Expected {expected_type.__name__}, got {type(config).__name__}"
                 )
 
-        backend_class = self._backends[backend_type]
-
         try:
             return backend_class(config)
         except Exception as e:
@@ -201,13 +290,7 @@ class MemoryBackendFactory:
         Raises:
             BackendNotFoundError: If backend type is not registered
         """
-        if backend_type not in self._backends:
-            available = list(self._backends.keys())
-            raise BackendNotFoundError(
-                f"Backend type '{backend_type}' not found. " f"Available backends: {available}"
-            )
-
-        return self._backends[backend_type]
+        return self._resolve_backend(backend_type)
 
     def get_config_class(self, backend_type: str) -> type[MemoryConfig]:
         """Get the configuration class for a given backend type.
@@ -221,13 +304,14 @@ class MemoryBackendFactory:
         Raises:
             BackendNotFoundError: If backend type is not registered
         """
-        if backend_type not in self._config_types:
+        config_class = self._config_types.get(backend_type)
+        if config_class is None:
             available = list(self._config_types.keys())
             raise BackendNotFoundError(
                 f"Backend type '{backend_type}' not found. " f"Available backends: {available}"
             )
 
-        return self._config_types[backend_type]
+        return config_class
 
     def create_from_env(
         self, backend_type_env: str = "BRUNO_MEMORY_BACKEND", **config_overrides
@@ -248,7 +332,7 @@ class MemoryBackendFactory:
         if not backend_type:
             raise ConfigurationError(
                 f"Environment variable {backend_type_env} not set. "
-                f"Available backends: {list(self._backends.keys())}"
+                f"Available backends: {list(self.list_backends().keys())}"
             )
 
         # Get configuration class and extract env-based config
@@ -308,6 +392,9 @@ class MemoryBackendFactory:
         )
 
 
+# Alias for the name used in older examples and integrations
+MemoryFactory = MemoryBackendFactory
+
 # Global factory instance
 factory = MemoryBackendFactory()
 
@@ -328,6 +415,19 @@ def register_backend(
     factory.register_backend(name, backend_class, config_class)
 
 
+def register_lazy_backend(
+    name: str, import_path: str, config_class: type[MemoryConfig] | None = None
+) -> None:
+    """Register a backend by import path in the global factory.
+
+    Args:
+        name: Backend name
+        import_path: Location of the backend class as 'module:ClassName'
+        config_class: Optional configuration class override
+    """
+    factory.register_lazy_backend(name, import_path, config_class)
+
+
 def create_backend(
     backend_type: str, config: MemoryConfig | None = None, **config_kwargs
 ) -> BaseMemoryBackend:
@@ -399,8 +499,10 @@ def create_with_fallback(
 
 __all__ = [
     "MemoryBackendFactory",
+    "MemoryFactory",
     "factory",
     "register_backend",
+    "register_lazy_backend",
     "create_backend",
     "create_config",
     "list_backends",
@@ -3,20 +3,47 @@ Memory management components for bruno-memory.
 
 Provides conversation management, context building, and memory retrieval
 functionality for managing conversation state and memory operations.
+
+Each manager is imported on first access, so using one manager does not
+load the dependencies of the others (e.g. bruno-llm for the compressor
+and embedding manager).
 """
 
-from .compressor import (
-    AdaptiveCompressor,
-    CompressionStrategy,
-    ImportanceFilterStrategy,
-    MemoryCompressor,
-    SummarizationStrategy,
-    TimeWindowStrategy,
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .compressor import (
+        AdaptiveCompressor,
+        CompressionStrategy,
+        ImportanceFilterStrategy,
+        MemoryCompressor,
+        SummarizationStrategy,
+        TimeWindowStrategy,
+    )
+    from .context_builder import ContextBuilder
+    from .conversation import ConversationManager
+    from .embedding import EmbeddingCache, EmbeddingManager
+    from .retriever import MemoryRetriever
+
+# Mapping of public name -> defining submodule
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConversationManager": "bruno_memory.managers.conversation",
+        "ContextBuilder": "bruno_memory.managers.context_builder",
+        "MemoryRetriever": "bruno_memory.managers.retriever",
+        "EmbeddingManager": "bruno_memory.managers.embedding",
+        "EmbeddingCache": "bruno_memory.managers.embedding",
+        "MemoryCompressor": "bruno_memory.managers.compressor",
+        "AdaptiveCompressor": "bruno_memory.managers.compressor",
+        "CompressionStrategy": "bruno_memory.managers.compressor",
+        "SummarizationStrategy": "bruno_memory.managers.compressor",
+        "ImportanceFilterStrategy": "bruno_memory.managers.compressor",
+        "TimeWindowStrategy": "bruno_memory.managers.compressor",
+    },
 )
-from .context_builder import ContextBuilder
-from .conversation import ConversationManager
-from .embedding import EmbeddingCache, EmbeddingManager
-from .retriever import MemoryRetriever
 
 __all__ = [
     "ConversationManager",
@@ -13,15 +13,12 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     import pandas as pd
 
-try:
-    import pandas as pd
+from bruno_core.models import MemoryEntry, Message
 
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    pd = None  # type: ignore
+from bruno_memory._lazy import is_available, lazy_import
 
-from bruno_core.models import MemoryEntry, Message
+pd = lazy_import("pandas")
+PANDAS_AVAILABLE = is_available("pandas")
 
 logger = logging.getLogger(__name__)
 
@@ -64,15 +61,10 @@ class MemoryAnalytics:
         total = len(messages)
 
         # Role distribution
-        roles = Counter(
-            msg.role.value if hasattr(msg.role, "value") else msg.role for msg in messages
-        )
+        roles = Counter(msg.role.value for msg in messages)
 
         # Message types
-        types = Counter(
-            msg.message_type.value if hasattr(msg.message_type, "value") else msg.message_type
-            for msg in messages
-        )
+        types = Counter(msg.message_type.value for msg in messages)
 
         # Content length stats
         lengths = [len(msg.content) for msg in messages]
@@ -135,10 +127,7 @@ class MemoryAnalytics:
         total = len(memories)
 
         # Memory type distribution
-        types = Counter(
-            mem.memory_type.value if hasattr(mem.memory_type, "value") else mem.memory_type
-            for mem in memories
-        )
+        types = Counter(mem.memory_type.value for mem in memories)
 
         # User distribution
         users = Counter(mem.user_id for mem in memories)
@@ -214,14 +203,8 @@ class MemoryAnalytics:
         # Role transitions (e.g., user -> assistant -> user)
         transitions = []
         for i in range(len(messages) - 1):
-            current_role = (
-                messages[i].role.value if hasattr(messages[i].role, "value") else messages[i].role
-            )
-            next_role = (
-                messages[i + 1].role.value
-                if hasattr(messages[i + 1].role, "value")
-                else messages[i + 1].role
-            )
+            current_role = messages[i].role.value
+            next_role = messages[i + 1].role.value
             transitions.append(f"{current_role} -> {next_role}")
 
         transition_counts = Counter(transitions)
@@ -238,9 +221,7 @@ class MemoryAnalytics:
         avg_response_time = sum(response_times) / len(response_times) if response_times else None
 
         # Turn taking
-        role_sequences = [
-            msg.role.value if hasattr(msg.role, "value") else msg.role for msg in messages
-        ]
+        role_sequences = [msg.role.value for msg in messages]
 
         return {
             "total_exchanges": len(transitions),
@@ -274,13 +255,9 @@ class MemoryAnalytics:
         data = [
             {
                 "id": str(msg.id),
-                "role": msg.role.value if hasattr(msg.role, "value") else msg.role,
+                "role": msg.role.value,
                 "content_length": len(msg.content),
-                "message_type": (
-                    msg.message_type.value
-                    if hasattr(msg.message_type, "value")
-                    else msg.message_type
-                ),
+                "message_type": msg.message_type.value,
                 "created_at": _get_timestamp(msg),
                 "session_id": (
                     msg.metadata.session_id
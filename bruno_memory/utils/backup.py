@@ -10,17 +10,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-try:
-    import pandas as pd
-
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-
 from bruno_core.models import MemoryEntry, Message
 
+from bruno_memory._lazy import is_available, lazy_import
 from bruno_memory.exceptions import BackupError
 
+pd = lazy_import("pandas")
+PANDAS_AVAILABLE = is_available("pandas")
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,13 +74,9 @@ class BackupExporter:
         data = [
             {
                 "id": str(msg.id),
-                "role": msg.role.value if hasattr(msg.role, "value") else msg.role,
+                "role": msg.role.value,
                 "content": msg.content,
-                "message_type": (
-                    msg.message_type.value
-                    if hasattr(msg.message_type, "value")
-                    else msg.message_type
-                ),
+                "message_type": msg.message_type.value,
                 "created_at": ts.isoformat() if (ts := _get_timestamp(msg)) else None,
                 "metadata": msg.metadata.model_dump() if msg.metadata else {},
             }
@@ -120,13 +113,9 @@ class BackupExporter:
         data = [
             {
                 "id": str(msg.id),
-                "role": msg.role.value if hasattr(msg.role, "value") else msg.role,
+                "role": msg.role.value,
                 "content": msg.content,
-                "message_type": (
-                    msg.message_type.value
-                    if hasattr(msg.message_type, "value")
-                    else msg.message_type
-                ),
+                "message_type": msg.message_type.value,
                 "created_at": ts.isoformat() if (ts := _get_timestamp(msg)) else None,
                 "session_id": (
                     msg.metadata.session_id
@@ -176,13 +165,9 @@ class BackupExporter:
         messages_data = [
             {
                 "id": str(msg.id),
-                "role": msg.role.value if hasattr(msg.role, "value") else msg.role,
+                "role": msg.role.value,
                 "content": msg.content[:1000],  # Truncate long content
-                "message_type": (
-                    msg.message_type.value
-                    if hasattr(msg.message_type, "value")
-                    else msg.message_type
-                ),
+                "message_type": msg.message_type.value,
                 "created_at": _get_timestamp(msg),
                 "session_id": (
                     msg.metadata.session_id
@@ -196,7 +181,7 @@ class BackupExporter:
         # Summary statistics
         roles = {}
         for msg in messages:
-            role = msg.role.value if hasattr(msg.role, "value") else msg.role
+            role = msg.role.value
             roles[role] = roles.get(role, 0) + 1
 
         summary_data = [{"role": k, "count": v} for k, v in roles.items()]
@@ -233,9 +218,7 @@ class BackupExporter:
             {
                 "id": str(mem.id),
                 "content": mem.content,
-                "memory_type": (
-                    mem.memory_type.value if hasattr(mem.memory_type, "value") else mem.memory_type
-                ),
+                "memory_type": mem.memory_type.value,
                 "user_id": str(mem.user_id) if mem.user_id else None,
                 "created_at": mem.created_at.isoformat() if mem.created_at else None,
                 "updated_at": mem.updated_at.isoformat() if mem.updated_at else None,
@@ -13,15 +13,12 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from typing import Any
 
-try:
-    import redis.asyncio as aioredis
-
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-
+from bruno_memory._lazy import is_available, lazy_import
 from bruno_memory.exceptions import CacheError
 
+aioredis = lazy_import("redis.asyncio")
+REDIS_AVAILABLE = is_available("redis")
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,14 +13,12 @@ from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 
-try:
-    import numpy as np
+from bruno_core.models import MemoryEntry
 
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
+from bruno_memory._lazy import is_available, lazy_import
 
-from bruno_core.models import MemoryEntry
+np = lazy_import("numpy")
+NUMPY_AVAILABLE = is_available("numpy")
 
 logger = logging.getLogger(__name__)
 
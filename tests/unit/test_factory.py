@@ -76,6 +76,27 @@ class TestMemoryBackendFactory:
         if "dummy" in factory._config_types:
             del factory._config_types["dummy"]
 
+    def test_register_backend_is_idempotent(self):
+        """Test re-registering the same backend class is a no-op."""
+        factory = MemoryBackendFactory(auto_discover=False, load_env=False)
+
+        factory.register_backend("sqlite", SQLiteMemoryBackend)
+        factory.register_backend("sqlite", SQLiteMemoryBackend)
+
+        assert factory.get_backend_class("sqlite") is SQLiteMemoryBackend
+        assert factory.list_backends() == {"sqlite": "SQLiteMemoryBackend"}
+
+    def test_lazy_backend_resolved_on_request(self):
+        """Test lazily registered backends are imported on first request."""
+        factory = MemoryBackendFactory(auto_discover=False, load_env=False)
+        factory.register_lazy_backend("sqlite", "bruno_memory.backends.sqlite:SQLiteMemoryBackend")
+
+        assert factory.list_backends() == {"sqlite": "SQLiteMemoryBackend"}
+        assert "sqlite" not in factory._backends
+
+        assert factory.get_backend_class("sqlite") is SQLiteMemoryBackend
+        assert "sqlite" not in factory._lazy_backends
+
     def test_create_from_env(self, temp_db_path, monkeypatch):
         """Test creating backend from environment variables."""
         monkeypatch.setenv("BRUNO_MEMORY_BACKEND", "sqlite")
@@ -152,6 +173,61 @@ class TestMemoryBackendFactory:
         assert len(backends) > 0
         assert "sqlite" in backends
 
+    def test_discover_backends_uses_cached_scan(self, mocker):
+        """Test entry points are scanned once and rescanned on refresh."""
+        import importlib
+
+        factory_module = importlib.import_module("bruno_memory.factory")
+        factory_module._backend_entry_points.cache_clear()
+        scan = mocker.patch.object(factory_module, "entry_points", return_value=[])
+
+        MemoryBackendFactory(load_env=False)
+        MemoryBackendFactory(load_env=False)
+        assert scan.call_count == 1
+
+        MemoryBackendFactory(auto_discover=False, load_env=False).discover_backends(refresh=True)
+        assert scan.call_count == 2
+
+        factory_module._backend_entry_points.cache_clear()
+
+    def test_missing_backend_driver_is_reported_once(self, mocker):
+        """Test a failed lazy backend import is memoized with an install hint."""
+        from bruno_memory import _lazy
+
+        getattr_, _ = _lazy.lazy_exports(
+            "bruno_memory.backends",
+            {"QdrantBackend": "bruno_memory.backends.vector"},
+            {"QdrantBackend": "qdrant-client"},
+        )
+        import_module = mocker.patch.object(
+            _lazy.importlib,
+            "import_module",
+            side_effect=ImportError("no qdrant_client", name="qdrant_client.http"),
+        )
+
+        for _ in range(2):
+            with pytest.raises(ImportError, match="pip install qdrant-client"):
+                getattr_("QdrantBackend")
+        assert import_module.call_count == 1
+
+    def test_backend_import_bug_is_not_reported_as_missing_driver(self, mocker):
+        """Test an unrelated import error in a backend module propagates unchanged."""
+        from bruno_memory import _lazy
+
+        getattr_, _ = _lazy.lazy_exports(
+            "bruno_memory.backends",
+            {"QdrantBackend": "bruno_memory.backends.vector"},
+            {"QdrantBackend": "qdrant-client"},
+        )
+        error = ImportError("cannot import name 'helper'", name="bruno_memory.utils")
+        import_module = mocker.patch.object(_lazy.importlib, "import_module", side_effect=error)
+
+        for _ in range(2):
+            with pytest.raises(ImportError) as excinfo:
+                getattr_("QdrantBackend")
+            assert excinfo.value is error
+        assert import_module.call_count == 2
+
     def test_list_backends(self):
         """Test listing registered backends."""
         backends = list_backends()
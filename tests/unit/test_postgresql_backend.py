@@ -99,6 +99,16 @@ class TestPostgreSQLBackend:
         assert pg_backend._pool is not None
         assert pg_backend._pool.get_size() > 0
 
+    async def test_backend_info_omits_password(self):
+        """Test get_backend_info never exposes the database password."""
+        backend = PostgreSQLMemoryBackend(PostgreSQLConfig(**POSTGRES_CONFIG))
+
+        info = backend.get_backend_info()
+        assert info["backend"] == "PostgreSQLMemoryBackend"
+        assert info["connected"] is False
+        assert info["config"]["host"] == POSTGRES_CONFIG["host"]
+        assert "password" not in info["config"]
+
     async def test_store_and_retrieve_message(self, pg_backend, sample_message):
         """Test storing and retrieving messages."""
         conversation_id = uuid4()
@@ -46,7 +46,9 @@ async def test_initialization(qdrant_config):
     """Test Qdrant initialization."""
     backend = QdrantBackend(qdrant_config)
 
-    with patch("bruno_memory.backends.vector.qdrant_backend.AsyncQdrantClient") as mock_qdrant:
+    with patch(
+        "bruno_memory.backends.vector.qdrant_backend.qdrant_client.AsyncQdrantClient"
+    ) as mock_qdrant:
         mock_client = AsyncMock()
         mock_qdrant.return_value = mock_client
 
@@ -64,7 +66,9 @@ async def test_initialization_creates_collection(qdrant_config):
     """Test collection creation during initialization."""
     backend = QdrantBackend(qdrant_config)
 
-    with patch("bruno_memory.backends.vector.qdrant_backend.AsyncQdrantClient") as mock_qdrant:
+    with patch(
+        "bruno_memory.backends.vector.qdrant_backend.qdrant_client.AsyncQdrantClient"
+    ) as mock_qdrant:
         mock_client = AsyncMock()
         mock_qdrant.return_value = mock_client
 
@@ -332,7 +336,9 @@ async def test_connection_error():
     config = QdrantConfig(host="invalid-host", port=6333, collection_name="test")
     backend = QdrantBackend(config)
 
-    with patch("bruno_memory.backends.vector.qdrant_backend.AsyncQdrantClient") as mock_qdrant:
+    with patch(
+        "bruno_memory.backends.vector.qdrant_backend.qdrant_client.AsyncQdrantClient"
+    ) as mock_qdrant:
         mock_client = AsyncMock()
         mock_qdrant.return_value = mock_client
         mock_client.get_collection = AsyncMock(side_effect=Exception("Connection failed"))
@@ -387,7 +393,9 @@ async def test_distance_metrics():
         )
         backend = QdrantBackend(config)
 
-        with patch("bruno_memory.backends.vector.qdrant_backend.AsyncQdrantClient") as mock_qdrant:
+        with patch(
+            "bruno_memory.backends.vector.qdrant_backend.qdrant_client.AsyncQdrantClient"
+        ) as mock_qdrant:
             mock_client = AsyncMock()
             mock_qdrant.return_value = mock_client
             mock_client.get_collection = AsyncMock(side_effect=Exception("Not found"))
@@ -115,6 +115,24 @@ class TestRedisBackend:
         assert messages[0].content == sample_message.content
         assert messages[0].role == sample_message.role
 
+    async def test_store_messages_batch(self, redis_backend, sample_message):
+        """Test storing several messages in one call."""
+        conversation_id = uuid4()
+        now = datetime.now()
+        batch = []
+        for i in range(3):
+            message = Message(**sample_message.model_dump())
+            message.content = f"Message {i}"
+            message.timestamp = now + timedelta(seconds=i)
+            batch.append(message)
+
+        message_ids = await redis_backend.store_messages(batch, conversation_id)
+        assert len(message_ids) == 3
+
+        messages = await redis_backend.retrieve_messages(conversation_id)
+        assert [m.content for m in messages] == ["Message 0", "Message 1", "Message 2"]
+        assert await redis_backend.store_messages([], conversation_id) == []
+
     async def test_retrieve_messages_with_filters(self, redis_backend, sample_message):
         """Test retrieving messages with time filters."""
         conversation_id = uuid4()
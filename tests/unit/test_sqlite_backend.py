@@ -1,6 +1,9 @@
 """Tests for SQLite backend."""
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
@@ -14,7 +17,13 @@ from bruno_core.models import (
 )
 
 from bruno_memory.backends.sqlite import SQLiteMemoryBackend
-from bruno_memory.exceptions import ConnectionError, OperationError, StorageError, ValidationError
+from bruno_memory.exceptions import (
+    ConnectionError,
+    DuplicateError,
+    OperationError,
+    StorageError,
+    ValidationError,
+)
 
 
 class TestSQLiteBackend:
@@ -193,6 +202,48 @@ class TestSQLiteBackend:
         # At least the session we just created should be there
         assert stats["active_sessions"] >= 0
 
+    async def test_get_statistics_per_user(self, sqlite_backend, sample_message):
+        """Test per-user statistics only count that user's conversations."""
+        await sqlite_backend.store_message(sample_message)
+        await sqlite_backend.get_context("stats-user", sample_message.conversation_id)
+        await sqlite_backend.get_context("other-user", str(uuid4()))
+
+        stats = await sqlite_backend.get_statistics("stats-user")
+        assert stats["message_count"] == 1
+        assert stats["conversation_count"] == 1
+        assert stats["user_count"] == 1
+
+        async with sqlite_backend._connection.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM conversation_contexts WHERE user_id = ?",
+            ("stats-user",),
+        ) as cursor:
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert "COVERING INDEX idx_conversation_contexts_user_conversation" in plan
+
+    async def test_context_upserts_keep_dependent_rows(self, sqlite_backend):
+        """Test re-storing a user or session context updates it in place."""
+        from bruno_core.models.context import UserContext
+
+        conversation_id = str(uuid4())
+        context = await sqlite_backend.get_context("upsert-user", conversation_id)
+        created_at = context.user.created_at
+
+        await sqlite_backend._store_user_context(UserContext(user_id="upsert-user", name="Ada"))
+        user = await sqlite_backend._get_or_create_user_context("upsert-user")
+        assert user.name == "Ada"
+        assert user.created_at == created_at
+
+        # Replacing the user row would have cascaded to its conversations
+        stats = await sqlite_backend.get_statistics("upsert-user")
+        assert stats["conversation_count"] == 1
+
+        session = context.session
+        session.is_active = False
+        await sqlite_backend.store_session_context(session)
+        stored = await sqlite_backend.get_session_context(session.session_id)
+        assert stored.is_active is False
+        assert stored.started_at == session.started_at
+
     async def test_validation_errors(self, sqlite_backend):
         """Test validation error handling."""
         # Test invalid message with empty content
@@ -276,3 +327,647 @@ class TestSQLiteBackend:
         results = await sqlite_backend.search_memories(query)
         assert len(results) == 1
         assert str(results[0].id) == mem_id_1
+
+    async def test_store_messages_batch(self, sqlite_backend):
+        """Test storing several messages in one transaction."""
+        conversation_id = "test-batch-conv"
+        messages = [
+            Message(
+                id=str(uuid4()),
+                conversation_id=conversation_id,
+                role=MessageRole.USER,
+                content=f"Batch message {i}",
+                timestamp=datetime.now() + timedelta(seconds=i),
+            )
+            for i in range(5)
+        ]
+
+        await sqlite_backend.store_messages(messages)
+
+        retrieved = await sqlite_backend.retrieve_messages(conversation_id)
+        assert [m.id for m in retrieved] == [m.id for m in messages]
+
+        # A duplicate anywhere in the batch stores nothing
+        extra = Message(
+            id=str(uuid4()),
+            conversation_id=conversation_id,
+            role=MessageRole.USER,
+            content="Not stored",
+            timestamp=datetime.now(),
+        )
+        with pytest.raises(DuplicateError):
+            await sqlite_backend.store_messages([extra, messages[0]])
+        assert len(await sqlite_backend.retrieve_messages(conversation_id)) == 5
+
+    async def test_store_memories_batch(self, sqlite_backend):
+        """Test storing several memory entries in one transaction."""
+        user_id = "test-batch-user"
+        entries = [
+            MemoryEntry(
+                id=str(uuid4()),
+                content=f"Batch memory {i}",
+                memory_type=MemoryType.EPISODIC,
+                user_id=user_id,
+                metadata=MemoryMetadata(),
+            )
+            for i in range(3)
+        ]
+
+        await sqlite_backend.store_memories(entries)
+
+        results = await sqlite_backend.retrieve_memories(user_id)
+        assert {str(r.id) for r in results} == {str(e.id) for e in entries}
+
+    async def test_deferred_commit_requires_flush(self, temp_db_path, sample_message):
+        """Test writes are only committed on flush when auto_commit is off."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path, auto_commit=False))
+        await backend.connect()
+        try:
+            await backend.store_message(sample_message)
+            assert backend._connection.in_transaction
+
+            await backend.flush()
+            assert not backend._connection.in_transaction
+        finally:
+            await backend.disconnect()
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path))
+        await backend.connect()
+        try:
+            messages = await backend.retrieve_messages(sample_message.conversation_id)
+            assert len(messages) == 1
+        finally:
+            await backend.disconnect()
+
+    async def test_connection_pragmas(self, sqlite_backend):
+        """Test performance PRAGMAs are applied from the configuration."""
+        config = sqlite_backend.config
+
+        async def pragma(name):
+            async with sqlite_backend._connection.execute(f"PRAGMA {name}") as cursor:
+                return (await cursor.fetchone())[0]
+
+        assert (await pragma("journal_mode")).upper() == config.journal_mode
+        assert await pragma("page_size") == config.page_size
+        assert await pragma("cache_size") == config.cache_size
+        assert await pragma("busy_timeout") == config.busy_timeout
+        assert await pragma("foreign_keys") == 1
+        assert await pragma("wal_autocheckpoint") == config.wal_autocheckpoint
+        assert sqlite_backend._connection.isolation_level == "IMMEDIATE"
+
+    async def test_periodic_maintenance_truncates_wal(self, temp_db_path, sample_message):
+        """Test the maintenance task checkpoints the WAL back to an empty file."""
+        from pathlib import Path
+
+        from bruno_memory.base.config import SQLiteConfig
+
+        config = SQLiteConfig(database_path=temp_db_path, maintenance_interval=0.05)
+        backend = SQLiteMemoryBackend(config)
+        await backend.connect()
+        try:
+            await backend.store_message(sample_message)
+            wal = Path(f"{temp_db_path}-wal")
+            assert wal.stat().st_size > 0
+
+            for _ in range(50):
+                await asyncio.sleep(0.02)
+                if wal.stat().st_size == 0:
+                    break
+            assert wal.stat().st_size == 0
+        finally:
+            await backend.disconnect()
+        assert backend._maintenance_task is None
+
+    async def test_manual_checkpoint(self, sqlite_backend, sample_message):
+        """Test checkpoint() drains the WAL and reports the pragma counters."""
+        from bruno_memory.exceptions import ValidationError
+
+        await sqlite_backend.store_message(sample_message)
+        busy, log_pages, checkpointed_pages = await sqlite_backend.checkpoint("passive")
+        assert busy == 0
+        assert log_pages > 0
+        assert checkpointed_pages == log_pages
+
+        assert await sqlite_backend.checkpoint() == (0, 0, 0)
+
+        with pytest.raises(ValidationError):
+            await sqlite_backend.checkpoint("TRUNCATE; DROP TABLE messages")
+
+    async def test_search_messages_full_text(self, sqlite_backend):
+        """Test message search uses the FTS index and respects filters."""
+        messages = [
+            Message(
+                id=str(uuid4()),
+                conversation_id=conversation_id,
+                role=MessageRole.USER,
+                content=content,
+                timestamp=datetime.now(),
+            )
+            for conversation_id, content in [
+                ("fts-conv-1", "The quick brown fox"),
+                ("fts-conv-2", "A quick reply: don't panic"),
+                ("fts-conv-2", "Nothing relevant here"),
+            ]
+        ]
+        await sqlite_backend.store_messages(messages)
+
+        results = await sqlite_backend.search_messages("quick")
+        assert {r.id for r in results} == {messages[0].id, messages[1].id}
+
+        results = await sqlite_backend.search_messages("quick", conversation_id="fts-conv-2")
+        assert [r.id for r in results] == [messages[1].id]
+
+        # Every term must match, in any order; a trailing * searches by prefix
+        results = await sqlite_backend.search_messages("fox quick")
+        assert [r.id for r in results] == [messages[0].id]
+        results = await sqlite_backend.search_messages("pan*")
+        assert [r.id for r in results] == [messages[1].id]
+
+        # FTS syntax characters in user input are treated as plain text
+        results = await sqlite_backend.search_messages("reply: \"don't")
+        assert [r.id for r in results] == [messages[1].id]
+        assert await sqlite_backend.search_messages('NOT ( "') == []
+
+    async def test_search_memories_full_text(self, sqlite_backend):
+        """Test memory text search reads FTS candidates first, then filters them."""
+        from bruno_memory.backends.sqlite.backend import _memory_search_sql
+
+        entries = [
+            MemoryEntry(
+                id=str(uuid4()),
+                content=content,
+                memory_type=MemoryType.SEMANTIC,
+                user_id=user_id,
+                metadata=MemoryMetadata(importance=importance),
+            )
+            for user_id, content, importance in [
+                ("fts-user-1", "Prefers green tea in the morning", 0.2),
+                ("fts-user-2", "Drinks green tea after lunch", 0.8),
+                ("fts-user-1", "Allergic to peanuts", 0.9),
+            ]
+        ]
+        await sqlite_backend.store_memories(entries)
+
+        query = MemoryQuery(query_text="green tea", user_id="fts-user-1")
+        results = await sqlite_backend.search_memories(query)
+        assert [str(r.id) for r in results] == [str(entries[0].id)]
+
+        # Importance lives in the metadata but is filtered in SQL
+        query = MemoryQuery(query_text="tea", user_id="fts-user-2", min_importance=0.5)
+        results = await sqlite_backend.search_memories(query)
+        assert [str(r.id) for r in results] == [str(entries[1].id)]
+        query = MemoryQuery(query_text="tea", user_id="fts-user-2", min_importance=0.9)
+        assert await sqlite_backend.search_memories(query) == []
+
+        sql = _memory_search_sql(True, False, True, 0, 0, False, True, False, True)
+        async with sqlite_backend._connection.execute(
+            f"EXPLAIN QUERY PLAN {sql}", ('"tea"', 100, "fts-user-1", 0.5, 10)
+        ) as cursor:
+            plan = [row["detail"] for row in await cursor.fetchall()]
+        assert "MATERIALIZE fts_matches" in plan
+        assert "SEARCH m USING INTEGER PRIMARY KEY (rowid=?)" in plan
+
+    async def test_schema_script_skipped_at_current_revision(self, temp_db_path):
+        """Test the schema script only runs for databases below SCHEMA_REVISION."""
+        from bruno_memory.backends.sqlite.schema import SCHEMA_REVISION
+        from bruno_memory.base.config import SQLiteConfig
+
+        config = SQLiteConfig(database_path=temp_db_path)
+
+        async def reconnect(*statements):
+            backend = SQLiteMemoryBackend(config)
+            await backend.connect()
+            try:
+                for statement in statements:
+                    await backend._connection.execute(statement)
+                await backend._connection.commit()
+                async with backend._connection.execute(
+                    "SELECT (SELECT user_version FROM pragma_user_version), "
+                    "EXISTS (SELECT 1 FROM sqlite_master WHERE name = 'memory_stats')"
+                ) as cursor:
+                    return tuple(await cursor.fetchone())
+            finally:
+                await backend.disconnect()
+
+        assert await reconnect("DROP VIEW memory_stats") == (SCHEMA_REVISION, 0)
+        # At the current revision the script is not re-run
+        assert await reconnect("PRAGMA user_version = 0") == (0, 0)
+        # An older revision re-applies the schema
+        assert await reconnect() == (SCHEMA_REVISION, 1)
+
+    async def test_full_text_search_disabled(self, temp_db_path):
+        """Test enable_fts=False drops the FTS tables and searches by substring."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        fts_objects_sql = "SELECT count(*) FROM sqlite_master WHERE name LIKE '%fts%'"
+        message = Message(
+            id=str(uuid4()),
+            conversation_id="no-fts-conv",
+            role=MessageRole.USER,
+            content="The quick brown fox",
+            timestamp=datetime.now(),
+        )
+        memory = MemoryEntry(
+            id=str(uuid4()),
+            content="Prefers green tea",
+            memory_type=MemoryType.SEMANTIC,
+            user_id="no-fts-user",
+        )
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path, enable_fts=False))
+        await backend.connect()
+        try:
+            async with backend._connection.execute(fts_objects_sql) as cursor:
+                assert (await cursor.fetchone())[0] == 0
+
+            await backend.store_message(message)
+            await backend.store_memory(memory)
+            results = await backend.search_messages("quick bro", conversation_id="no-fts-conv")
+            assert [r.id for r in results] == [message.id]
+            query = MemoryQuery(query_text="green", user_id="no-fts-user")
+            assert [str(r.id) for r in await backend.search_memories(query)] == [str(memory.id)]
+        finally:
+            await backend.disconnect()
+
+        # Turning FTS back on recreates the tables and indexes existing rows
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path))
+        await backend.connect()
+        try:
+            assert [r.id for r in await backend.search_messages("fox")] == [message.id]
+            query = MemoryQuery(query_text="tea", user_id="no-fts-user")
+            assert [str(r.id) for r in await backend.search_memories(query)] == [str(memory.id)]
+        finally:
+            await backend.disconnect()
+
+    async def test_importance_columns_backfilled(self, temp_db_path):
+        """Test rows written before the importance columns were filled are upgraded."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        config = SQLiteConfig(database_path=temp_db_path)
+        memory = MemoryEntry(
+            id=str(uuid4()),
+            content="Important memory",
+            memory_type=MemoryType.SEMANTIC,
+            user_id="test-backfill-user",
+            metadata=MemoryMetadata(importance=0.8),
+        )
+        backend = SQLiteMemoryBackend(config)
+        await backend.connect()
+        await backend.store_memory(memory)
+        # Simulate a database from before the columns were written
+        await backend._connection.execute("UPDATE memory_entries SET importance = 0.0")
+        await backend._connection.execute("PRAGMA user_version = 0")
+        await backend._connection.commit()
+        await backend.disconnect()
+
+        backend = SQLiteMemoryBackend(config)
+        await backend.connect()
+        try:
+            query = MemoryQuery(user_id="test-backfill-user", min_importance=0.5)
+            assert [str(m.id) for m in await backend.search_memories(query)] == [str(memory.id)]
+        finally:
+            await backend.disconnect()
+
+    async def test_memory_tag_filtering(self, sqlite_backend):
+        """Test tag filters match whole tags and require every tag."""
+        user_id = "test-tag-user"
+        entries = [
+            MemoryEntry(
+                id=str(uuid4()),
+                content=f"Tagged memory {i}",
+                memory_type=MemoryType.EPISODIC,
+                user_id=user_id,
+                metadata=MemoryMetadata(tags=tags),
+            )
+            for i, tags in enumerate([{"cat", "pet"}, {"cataract"}, {"cat"}])
+        ]
+        await sqlite_backend.store_memories(entries)
+
+        results = await sqlite_backend.search_memories(MemoryQuery(user_id=user_id, tags=["cat"]))
+        assert {str(r.id) for r in results} == {str(entries[0].id), str(entries[2].id)}
+
+        query = MemoryQuery(user_id=user_id, tags=["cat", "pet"])
+        results = await sqlite_backend.search_memories(query)
+        assert [str(r.id) for r in results] == [str(entries[0].id)]
+
+    async def test_memory_search_sql_reused_per_query_shape(self, sqlite_backend):
+        """Test repeated query shapes reuse one SQL string regardless of values."""
+        from bruno_memory.backends.sqlite import backend as backend_module
+
+        backend_module._memory_search_sql.cache_clear()
+        for user_id in ("shape-user-1", "shape-user-2"):
+            await sqlite_backend.search_memories(MemoryQuery(user_id=user_id, tags=["a"]))
+        await sqlite_backend.search_memories(MemoryQuery(user_id="shape-user-1"))
+
+        info = backend_module._memory_search_sql.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    async def test_expired_memories_filtered(self, sqlite_backend):
+        """Test expired memories are only returned when explicitly requested."""
+        user_id = "test-expiry-user"
+        now = datetime.now(timezone.utc)
+        expiries = [now - timedelta(hours=1), now + timedelta(hours=1), None]
+        expired, live, permanent = (
+            MemoryEntry(
+                id=str(uuid4()),
+                content=f"Expiring memory {i}",
+                memory_type=MemoryType.EPISODIC,
+                user_id=user_id,
+                metadata=MemoryMetadata(),
+                expires_at=expires_at,
+            )
+            for i, expires_at in enumerate(expiries)
+        )
+        await sqlite_backend.store_memories([expired, live, permanent])
+
+        results = await sqlite_backend.search_memories(MemoryQuery(user_id=user_id))
+        assert {str(r.id) for r in results} == {str(live.id), str(permanent.id)}
+
+        query = MemoryQuery(user_id=user_id, include_expired=True)
+        results = await sqlite_backend.search_memories(query)
+        assert len(results) == 3
+
+    async def test_get_context_uses_latest_messages(self, sqlite_backend):
+        """Test context holds the newest messages in chronological order."""
+        conversation_id = "test-window-conv"
+        start = datetime.now()
+        messages = [
+            Message(
+                id=str(uuid4()),
+                conversation_id=conversation_id,
+                role=MessageRole.USER,
+                content=f"Window message {i}",
+                timestamp=start + timedelta(seconds=i),
+            )
+            for i in range(5)
+        ]
+        await sqlite_backend.store_messages(messages)
+
+        window = await sqlite_backend.get_context_window(conversation_id, 2)
+        assert [m.id for m in window] == [m.id for m in messages[-2:]]
+
+        context = await sqlite_backend.get_context("test-window-user", conversation_id, 3)
+        assert [m.id for m in context.messages] == [m.id for m in messages[-3:]]
+
+    async def test_get_context_commits_created_rows(self, sqlite_backend, temp_db_path):
+        """Test rows created by get_context are committed and visible to other connections."""
+        await sqlite_backend.get_context("commit-user", "commit-conv")
+
+        assert not sqlite_backend._connection.in_transaction
+
+        connection = sqlite3.connect(temp_db_path)
+        try:
+            for table, column, value in (
+                ("user_contexts", "user_id", "commit-user"),
+                ("conversation_contexts", "conversation_id", "commit-conv"),
+                ("session_contexts", "conversation_id", "commit-conv"),
+            ):
+                row = connection.execute(
+                    f"SELECT COUNT(*) FROM {table} WHERE {column} = ?", (value,)
+                ).fetchone()
+                assert row[0] == 1, table
+        finally:
+            connection.close()
+
+    async def test_user_context_cached(self, sqlite_backend, monkeypatch):
+        """Test concurrent and repeated user context lookups share one load."""
+        loads = []
+        load_user_context = sqlite_backend._get_or_create_user_context
+
+        async def counting_load(user_id):
+            loads.append(user_id)
+            return await load_user_context(user_id)
+
+        monkeypatch.setattr(sqlite_backend, "_get_or_create_user_context", counting_load)
+
+        first, second = await asyncio.gather(
+            sqlite_backend.get_context("cached-user", "cached-conv-1"),
+            sqlite_backend.get_context("cached-user", "cached-conv-2"),
+        )
+        await sqlite_backend.get_context("cached-user", "cached-conv-3")
+
+        assert loads == ["cached-user"]
+        assert first.user.user_id == second.user.user_id == "cached-user"
+        assert first.user is not second.user
+
+    async def test_user_context_cache_invalidated_on_store(self, sqlite_backend):
+        """Test storing a user context replaces the cached copy."""
+        user_context = await sqlite_backend._get_user_context("renamed-user")
+        assert "renamed-user" in sqlite_backend._user_contexts
+
+        user_context.name = "Renamed"
+        await sqlite_backend._store_user_context(user_context)
+
+        assert not sqlite_backend._connection.in_transaction
+        assert (await sqlite_backend._get_user_context("renamed-user")).name == "Renamed"
+
+    async def test_user_context_not_cached_while_uncommitted(self, temp_db_path):
+        """Test user contexts created in a pending transaction are not cached."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path, auto_commit=False))
+        await backend.connect()
+        try:
+            await backend._get_user_context("pending-user")
+            assert backend._connection.in_transaction
+            assert "pending-user" not in backend._user_contexts
+        finally:
+            await backend.disconnect()
+
+    async def test_in_memory_database(self, sample_message):
+        """Test an in-memory database connects and serves reads from the writer."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=":memory:"))
+        await backend.connect()
+        try:
+            assert backend._read_pool is None
+            await backend.store_message(sample_message)
+            assert len(await backend.retrieve_messages(sample_message.conversation_id)) == 1
+        finally:
+            await backend.disconnect()
+
+    async def test_reads_use_read_pool(self, temp_db_path, sample_message):
+        """Test reads use the pool unless the writer has pending changes."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        config = SQLiteConfig(database_path=temp_db_path, auto_commit=False, read_pool_size=2)
+        backend = SQLiteMemoryBackend(config)
+        await backend.connect()
+        try:
+            assert len(backend._read_pool) == 2
+            async with backend._reading() as connection:
+                assert connection is not backend._connection
+
+            await backend.store_message(sample_message)
+            async with backend._reading() as connection:
+                assert connection is backend._connection
+            assert len(await backend.retrieve_messages(sample_message.conversation_id)) == 1
+
+            await backend.flush()
+            results = await asyncio.gather(
+                *(backend.retrieve_messages(sample_message.conversation_id) for _ in range(4))
+            )
+            assert all(len(messages) == 1 for messages in results)
+        finally:
+            await backend.disconnect()
+        assert backend._read_pool is None
+
+    async def test_embedding_stored_outside_metadata_json(self, sqlite_backend):
+        """Test embeddings round-trip through the BLOB column, not the metadata JSON."""
+        embedding = [0.25, -0.5, 1.0, 0.125]
+        memory = MemoryEntry(
+            id=str(uuid4()),
+            content="Memory with an embedding",
+            memory_type=MemoryType.SEMANTIC,
+            user_id="test-embedding-user",
+            metadata=MemoryMetadata(embedding=embedding, tags={"vector"}),
+        )
+        await sqlite_backend.store_memory(memory)
+
+        async with sqlite_backend._connection.execute(
+            "SELECT metadata, embedding FROM memory_entries WHERE id = ?", (str(memory.id),)
+        ) as cursor:
+            row = await cursor.fetchone()
+        assert "embedding" not in json.loads(row["metadata"])
+        assert len(row["embedding"]) == 4 * len(embedding)
+
+        retrieved = await sqlite_backend.get_memory(memory.id)
+        assert retrieved.metadata.embedding == embedding
+        assert set(retrieved.metadata.tags) == {"vector"}
+
+    async def test_async_insert_buffers_writes(self, temp_db_path):
+        """Test buffered inserts are written in batches and visible after flush."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        config = SQLiteConfig(
+            database_path=temp_db_path, async_insert=True, async_insert_wait_time=0.2
+        )
+        backend = SQLiteMemoryBackend(config)
+        await backend.connect()
+        try:
+            conversation_id = "test-async-conv"
+            messages = [
+                Message(
+                    id=str(uuid4()),
+                    conversation_id=conversation_id,
+                    role=MessageRole.USER,
+                    content=f"Buffered message {i}",
+                    timestamp=datetime.now() + timedelta(seconds=i),
+                )
+                for i in range(3)
+            ]
+            for message in messages:
+                await backend.store_message(message)
+            # A duplicate is dropped without losing the rest of its batch
+            await backend.store_message(messages[0])
+
+            await backend.flush()
+
+            retrieved = await backend.retrieve_messages(conversation_id)
+            assert [m.id for m in retrieved] == [m.id for m in messages]
+        finally:
+            await backend.disconnect()
+        assert backend._write_task is None
+
+    async def test_failed_batch_keeps_pending_writes(self, temp_db_path, sample_message):
+        """Test a failed batch does not discard earlier uncommitted writes."""
+        from bruno_memory.base.config import SQLiteConfig
+
+        backend = SQLiteMemoryBackend(SQLiteConfig(database_path=temp_db_path, auto_commit=False))
+        await backend.connect()
+        try:
+            await backend.store_message(sample_message)
+            with pytest.raises(DuplicateError):
+                await backend.store_messages([sample_message])
+            await backend.flush()
+
+            messages = await backend.retrieve_messages(sample_message.conversation_id)
+            assert len(messages) == 1
+        finally:
+            await backend.disconnect()
+
+    async def test_bulk_load_indexes_rows(self, sqlite_backend):
+        """Test bulk-loaded rows are searchable and FTS triggers are restored."""
+        messages = [
+            Message(
+                id=str(uuid4()),
+                conversation_id="test-bulk-conv",
+                role=MessageRole.USER,
+                content=f"Imported message about topic{i}",
+                timestamp=datetime.now(),
+            )
+            for i in range(3)
+        ]
+        memories = [
+            MemoryEntry(
+                id=str(uuid4()),
+                content="Imported memory about gardening",
+                memory_type=MemoryType.SEMANTIC,
+                user_id="test-bulk-user",
+                metadata=MemoryMetadata(),
+            )
+        ]
+        await sqlite_backend.bulk_load(messages, memories)
+
+        assert len(await sqlite_backend.search_messages("imported")) == 3
+        query = MemoryQuery(user_id="test-bulk-user", query_text="gardening")
+        assert len(await sqlite_backend.search_memories(query)) == 1
+
+        async with sqlite_backend._connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_fts_%'"
+        ) as cursor:
+            assert (await cursor.fetchone())[0] == 6
+
+        # A failed load imports nothing and keeps the triggers
+        with pytest.raises(DuplicateError):
+            await sqlite_backend.bulk_load([messages[0]])
+        await sqlite_backend.store_message(
+            Message(
+                id=str(uuid4()),
+                conversation_id="test-bulk-conv",
+                role=MessageRole.USER,
+                content="Stored after the failed import",
+                timestamp=datetime.now(),
+            )
+        )
+        assert len(await sqlite_backend.search_messages("failed import")) == 1
+
+    async def test_bulk_load_excludes_concurrent_writes(self, sqlite_backend):
+        """Test writes during a failing bulk load cannot commit the trigger-less state."""
+
+        def message(content):
+            return Message(
+                id=str(uuid4()),
+                conversation_id="test-bulk-race",
+                role=MessageRole.USER,
+                content=content,
+                timestamp=datetime.now(),
+            )
+
+        existing = message("Already stored")
+        await sqlite_backend.store_message(existing)
+        batch = [message(f"Imported zebra {i}") for i in range(2000)] + [existing]
+
+        async def store_concurrently():
+            for i in range(20):
+                await sqlite_backend.store_message(message(f"Concurrent okapi {i}"))
+                await asyncio.sleep(0)
+
+        results = await asyncio.gather(
+            sqlite_backend.bulk_load(batch), store_concurrently(), return_exceptions=True
+        )
+        assert isinstance(results[0], DuplicateError)
+        assert results[1] is None
+
+        async with sqlite_backend._connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_fts_%'"
+        ) as cursor:
+            assert (await cursor.fetchone())[0] == 6
+        assert await sqlite_backend.search_messages("zebra") == []
+        assert len(await sqlite_backend.search_messages("okapi")) == 20
+
+        await sqlite_backend.store_message(message("Stored afterwards giraffe"))
+        assert len(await sqlite_backend.search_messages("giraffe")) == 1